@@ -1,5 +1,6 @@
 import os
 import pathlib
+import time
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import serialization, hashes
@@ -8,23 +9,39 @@ import json
 import base64
 
 
+# Resolved keys directory; set after the first successful mkdir
+_KEYS_DIR_CACHE: Path | None = None
+
+
 def get_keys_directory() -> Path:
     """Get a user-writable directory for storing encryption keys.
     Returns a Path object to ~/Documents/TinyEncryptor_Keys/
-    Creates the directory if it doesn't exist.
+    Creates the directory if it doesn't exist. The result is cached, so only
+    the first call touches the filesystem.
     """
+    global _KEYS_DIR_CACHE
+    if _KEYS_DIR_CACHE is not None:
+        return _KEYS_DIR_CACHE
+
     # Use Documents folder which is always writable
     keys_dir = Path.home() / "Documents" / "TinyEncryptor_Keys"
 
-    # Create directory if it doesn't exist
+    # Create directory if it doesn't exist; exist_ok avoids a separate stat
     try:
         keys_dir.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
+    except OSError as e:
         print(f"Warning: Could not create keys directory at {keys_dir}: {e}")
         # Fallback to home directory if Documents is not accessible
+        primary_dir = keys_dir
         keys_dir = Path.home() / ".tinyencryptor_keys"
-        keys_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            keys_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as fallback_error:
+            raise OSError(
+                f"Could not create a keys directory at {primary_dir} or {keys_dir}"
+            ) from fallback_error
 
+    _KEYS_DIR_CACHE = keys_dir
     return keys_dir
 
 
@@ -94,9 +111,9 @@ def generate_rsa_key_pair(passphrase=None, key_size=2048) -> tuple:
         return None, None, None
 
 
-def retrieve_rsa_keys() -> tuple:
+def retrieve_rsa_keys(keys_dir: Path | None = None) -> tuple:
     """Retrieve and display saved RSA keys from files"""
-    keys_dir = get_keys_directory()
+    keys_dir = Path(keys_dir) if keys_dir else get_keys_directory()
     private_key_file = keys_dir / "private_key.pem"
     public_key_file = keys_dir / "public_key.pem"
 
@@ -130,7 +147,10 @@ def retrieve_rsa_keys() -> tuple:
 
 
 def import_external_rsa_keys(
-    private: str = None, public: str = None, passphrase: str = None
+    private: str = None,
+    public: str = None,
+    passphrase: str = None,
+    keys_dir: Path | None = None,
 ) -> tuple:
     """Import external RSA keys from user input"""
     try:
@@ -181,7 +201,7 @@ def import_external_rsa_keys(
                 pass
 
             # Save keys to files in user-writable directory
-            keys_dir = get_keys_directory()
+            keys_dir = Path(keys_dir) if keys_dir else get_keys_directory()
             public_key_path = keys_dir / "public_key.pem"
             private_key_path = keys_dir / "private_key.pem"
 
@@ -467,20 +487,23 @@ def encrypt_file_with_fernet(file_path: str) -> tuple:
 
 
 def decrypt_file_with_fernet(
-    encrypted_data: str, key: str, output_filename: str = None
+    encrypted_data: str | bytes, key: str | bytes, output_filename: str = None
 ) -> bool:
-    """Decrypt a file using Fernet decryption"""
+    """Decrypt a file using Fernet decryption
+    The token may be given as bytes (e.g. read with "rb") to skip a UTF-8
+    round-trip; Fernet runs AES through cryptography's OpenSSL backend.
+    """
     try:
-        # Decrypt the data
-        fernet = Fernet(key.encode())
-        decrypted_b64 = fernet.decrypt(encrypted_data.encode())
+        # Decrypt the data; Fernet accepts str or bytes for key and token
+        fernet = Fernet(key)
+        decrypted_b64 = fernet.decrypt(encrypted_data)
 
         # Decode from base64
-        file_data = base64.b64decode(decrypted_b64.decode())
+        file_data = base64.b64decode(decrypted_b64)
 
         # Generate output filename if not provided
         if not output_filename:
-            output_filename = f"decrypted_{int(os.time.time())}.bin"
+            output_filename = f"decrypted_{int(time.time())}.bin"
 
         # Write decrypted file
         with open(output_filename, "wb") as f:
@@ -547,7 +570,7 @@ def decrypt_file_with_rsa(
 
         # Generate output filename if not provided
         if not output_filename:
-            output_filename = f"decrypted_{int(os.time.time())}.bin"
+            output_filename = f"decrypted_{int(time.time())}.bin"
 
         # Write decrypted file
         with open(output_filename, "wb") as f:
@@ -830,19 +853,19 @@ def main():
                 # Simple Fernet encryption
                 if data_type == "1":
                     # Encrypt text data
-                    
-                    encrypted_result:dict = {}
-                    key:str = ""
+
+                    encrypted_result: dict = {}
+                    key: str = ""
                     encrypted_result, key = encrypt_data_not_binary(
                         data=data_to_encrypt
                     )
-                 
+
                     # Convert key to string for dictionary lookup
                     key_str = key.decode() if isinstance(key, bytes) else key
                     encrypted_data = encrypted_result.get(key_str, "")
                     print(f"Encrypted data: {encrypted_data}")
                     print(f"Encryption key: {key_str} Please save it securely!")
-                    
+
                 else:
                     # Encrypt file
                     encrypted_result, key, filename = encrypt_file_with_fernet(
@@ -7,7 +7,7 @@ import sys
 import os
 from pathlib import Path
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, mock_open
 import tempfile
 import json
 
@@ -18,6 +18,9 @@ sys.path.insert(0, str(PARENT_DIR))
 import user_interface
 import main
 
+# Set TINYENC_SKIP_CRYPTO=1 to skip the RSA/Fernet-heavy classes (fast lane)
+_SKIP_CRYPTO = os.environ.get("TINYENC_SKIP_CRYPTO") == "1"
+
 
 class TestUserInterfaceSettings(unittest.TestCase):
     """Test settings management functions"""
@@ -54,6 +57,29 @@ class TestUserInterfaceSettings(unittest.TestCase):
         self.assertEqual(loaded_settings["theme"], "Dark")
         self.assertEqual(loaded_settings["custom"], "value")
 
+    def test_load_settings_uses_cache(self):
+        """Test settings.json is parsed once until the cache is invalidated"""
+        user_interface.save_settings({"theme": "Light"})
+        user_interface.invalidate_settings_cache()
+
+        with patch(
+            "user_interface._settings_loads", wraps=user_interface._settings_loads
+        ) as mock_load:
+            first = user_interface.load_settings()
+            first["theme"] = "Mutated"
+            second = user_interface.load_settings()
+
+        mock_load.assert_called_once()
+        self.assertEqual(second["theme"], "Light")
+
+    def test_save_settings_skips_unchanged(self):
+        """Test saving identical settings does not rewrite the file"""
+        user_interface.save_settings({"theme": "Dark"})
+        with patch("user_interface.atomic_write_bytes") as mock_write:
+            result = user_interface.save_settings({"theme": "Dark"})
+        self.assertTrue(result)
+        mock_write.assert_not_called()
+
     def test_save_settings_error_handling(self):
         """Test save_settings handles errors gracefully"""
         user_interface.SETTINGS_FILE = Path("/invalid/path/settings.json")
@@ -67,12 +93,10 @@ class TestRSAKeyFunctions(unittest.TestCase):
     def setUp(self):
         """Set up test environment"""
         self.test_dir = tempfile.mkdtemp()
-        self.original_dir = os.getcwd()
-        os.chdir(self.test_dir)
+        self.keys_dir = Path(self.test_dir)
 
     def tearDown(self):
         """Clean up test environment"""
-        os.chdir(self.original_dir)
         import shutil
 
         if Path(self.test_dir).exists():
@@ -80,29 +104,43 @@ class TestRSAKeyFunctions(unittest.TestCase):
 
     def test_retrieve_rsa_keys_no_files(self):
         """Test retrieving RSA keys when files don't exist"""
-        result = user_interface.retrieve_rsa_keys("public")
+        result = user_interface.retrieve_rsa_keys("public", keys_dir=self.keys_dir)
         self.assertIn("Key files not found", result)
 
+    @unittest.skipIf(_SKIP_CRYPTO, "generates an RSA key pair")
     def test_retrieve_rsa_keys_with_files(self):
         """Test retrieving RSA keys when files exist"""
         # Generate test keys
         private_key, public_key, _ = main.generate_rsa_key_pair()
 
         # Save keys
-        with open("public_key.pem", "w") as f:
-            f.write(public_key)
-        with open("private_key.pem", "w") as f:
-            f.write(private_key)
+        (self.keys_dir / "public_key.pem").write_text(public_key)
+        (self.keys_dir / "private_key.pem").write_text(private_key)
 
         # Test public key retrieval
-        result = user_interface.retrieve_rsa_keys("public")
+        result = user_interface.retrieve_rsa_keys("public", keys_dir=self.keys_dir)
         self.assertIn("BEGIN PUBLIC KEY", result)
 
         # Test private key retrieval
-        result = user_interface.retrieve_rsa_keys("private")
+        result = user_interface.retrieve_rsa_keys("private", keys_dir=self.keys_dir)
         self.assertIn("BEGIN", result)
         self.assertIn("PRIVATE KEY", result)
 
+    def test_cached_rsa_keys_reload_on_change(self):
+        """Test cached keys are reused until a PEM file changes"""
+        (self.keys_dir / "public_key.pem").write_text("public-1")
+        (self.keys_dir / "private_key.pem").write_text("private-1")
+
+        with patch("main.retrieve_rsa_keys", wraps=main.retrieve_rsa_keys) as mock_read:
+            user_interface.get_cached_rsa_keys(self.keys_dir)
+            user_interface.get_cached_rsa_keys(self.keys_dir)
+            self.assertEqual(mock_read.call_count, 1)
+
+            (self.keys_dir / "public_key.pem").write_text("public-22")
+            result = user_interface.get_cached_rsa_keys(self.keys_dir)
+            self.assertEqual(mock_read.call_count, 2)
+            self.assertEqual(result[2], "public-22")
+
 
 class TestInfoPanelFunctions(unittest.TestCase):
     """Test information panel helper functions"""
@@ -119,7 +157,7 @@ class TestInfoPanelFunctions(unittest.TestCase):
     def test_clear_info(self):
         """Test clearing info panel"""
         user_interface.clear_info(self.mock_text)
-        self.mock_text.configure.assert_called()
+        self.mock_text.configure.assert_not_called()
         self.mock_text.delete.assert_called_with("1.0", "end")
 
     def test_set_info_basic(self):
@@ -127,6 +165,23 @@ class TestInfoPanelFunctions(unittest.TestCase):
         user_interface.set_info(self.mock_text, "Test content")
         self.mock_text.insert.assert_called_with("1.0", "Test content")
 
+    def test_set_info_keeps_unchanged_wrap(self):
+        """Test the panel is not reconfigured when its wrap mode already matches"""
+        self.mock_text.cget.return_value = "char"
+        user_interface.set_info(self.mock_text, "Test content")
+        self.mock_text.configure.assert_not_called()
+
+    def test_read_only_key_filter(self):
+        """Test typing is blocked while navigation and copy still pass"""
+
+        def key(keysym, state=0):
+            return Mock(keysym=keysym, state=state)
+
+        self.assertEqual(user_interface._read_only_key(key("x")), "break")
+        self.assertEqual(user_interface._read_only_key(key("v", 0x4)), "break")
+        self.assertIsNone(user_interface._read_only_key(key("c", 0x4)))
+        self.assertIsNone(user_interface._read_only_key(key("Down")))
+
     def test_set_info_with_color(self):
         """Test setting info with custom color"""
         user_interface.set_info(self.mock_text, "Test content", color="#FF0000")
@@ -135,6 +190,63 @@ class TestInfoPanelFunctions(unittest.TestCase):
         call_args = self.mock_text.tag_config.call_args
         self.assertIn("foreground", str(call_args))
 
+    def test_set_info_reuses_configured_tag(self):
+        """Test an already-configured color tag is not reconfigured"""
+        self.mock_text.tag_cget.return_value = "#FF0000"
+        user_interface.set_info(self.mock_text, "Test content", color="#FF0000")
+        self.mock_text.tag_config.assert_not_called()
+        self.mock_text.tag_add.assert_called_with("color_FF0000", "1.0", "end")
+
+    def test_color_tags_created_for_unknown_tags(self):
+        """Test tags Tk does not know yet are created instead of crashing"""
+        self.mock_text.tag_cget.side_effect = user_interface.tk.TclError(
+            'tag "color_FFFFFF" isn\'t defined'
+        )
+        user_interface.init_color_tags(self.mock_text)
+        self.mock_text.tag_config.assert_any_call("color_FFFFFF", foreground="#FFFFFF")
+        self.assertEqual(self.mock_text.tag_config.call_count, 3)
+
+    def test_post_info_coalesces(self):
+        """Test queued info posts collapse into one write of the last content"""
+        user_interface.post_info(self.mock_text, "first")
+        user_interface.post_info(self.mock_text, "second")
+        self.mock_text.after_idle.assert_called_once()
+        flush, widget = self.mock_text.after_idle.call_args.args
+        flush(widget)
+        self.mock_text.insert.assert_called_once_with("1.0", "second")
+
+    def test_set_info_cancels_queued_post(self):
+        """Test a direct set_info is not overwritten by an earlier queued post"""
+        user_interface.post_info(self.mock_text, "queued")
+        user_interface.set_info(self.mock_text, "direct")
+        flush, widget = self.mock_text.after_idle.call_args.args
+        flush(widget)
+        self.mock_text.insert.assert_called_once_with("1.0", "direct")
+
+    def test_set_info_chunks(self):
+        """Test setting info from text fragments"""
+        user_interface.set_info_chunks(
+            self.mock_text, ["Header\n", "Body"], color="#FF0000"
+        )
+        self.mock_text.delete.assert_called_with("1.0", "end")
+        inserted = [c.args[1] for c in self.mock_text.insert.call_args_list]
+        self.assertEqual(inserted, ["Header\n", "Body"])
+
+    def test_insert_colored_line(self):
+        """Test inserting a colored line at a known line number"""
+        user_interface.insert_colored_line(
+            self.mock_text, 7, "[secret]", "#c91658", "passphrase_red"
+        )
+        self.mock_text.insert.assert_called_with("7.0", "[secret]\n")
+        self.mock_text.tag_add.assert_called_with("passphrase_red", "7.0", "8.0")
+        self.mock_text.get.assert_not_called()
+
+    def test_set_lines(self):
+        """Test header and lines go in with a single insert"""
+        user_interface.set_lines(self.mock_text, "Files:", ["a.txt", "b.txt"])
+        self.mock_text.delete.assert_called_with("1.0", "end")
+        self.mock_text.insert.assert_called_once_with("end", "Files:\na.txt\nb.txt\n")
+
 
 class TestFileOperations(unittest.TestCase):
     """Test file operation functions"""
@@ -173,26 +285,82 @@ class TestFileOperations(unittest.TestCase):
         result = user_interface.choose_files(multiple=False)
         self.assertEqual(len(result), 0)
 
-
+    @patch("user_interface.subprocess.Popen")
+    def test_open_directory_does_not_wait(self, mock_popen):
+        """Test the file manager is spawned detached, not waited on"""
+        if sys.platform == "win32":
+            self.skipTest("Windows uses os.startfile")
+        user_interface.open_directory(Path(self.test_dir))
+        args, kwargs = mock_popen.call_args
+        self.assertEqual(args[0][-1], str(Path(self.test_dir)))
+        self.assertTrue(kwargs["start_new_session"])
+        mock_popen.return_value.wait.assert_not_called()
+
+    def test_write_key_files(self):
+        """Test PEM files are written atomically with no temp file left"""
+        key_path = Path(self.test_dir) / "public_key.pem"
+        user_interface.write_key_files((key_path, "-----BEGIN KEY-----\n"))
+        self.assertEqual(key_path.read_bytes(), b"-----BEGIN KEY-----\n")
+        self.assertFalse((Path(self.test_dir) / "public_key.pem.tmp").exists())
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX file modes only")
+    def test_write_key_files_keeps_mode(self):
+        """Test rewriting a key file keeps its permissions; new files are 0600"""
+        key_path = Path(self.test_dir) / "private_key.pem"
+        user_interface.write_key_files((key_path, "first\n"))
+        self.assertEqual(key_path.stat().st_mode & 0o777, 0o600)
+
+        key_path.chmod(0o640)
+        user_interface.write_key_files((key_path, "second\n"))
+        self.assertEqual(key_path.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(key_path.read_bytes(), b"second\n")
+
+
+class TestBackgroundWork(unittest.TestCase):
+    """Test the worker-pool helper used to keep the Tk thread free"""
+
+    def test_run_in_background_delivers_result(self):
+        """Test the result is handed back through widget.after polling"""
+        import time
+
+        mock_widget = Mock()
+        mock_widget.after.side_effect = lambda ms, fn: (time.sleep(ms / 1000), fn())
+        on_done = Mock()
+
+        user_interface.run_in_background(mock_widget, on_done, pow, 2, 10)
+
+        on_done.assert_called_once()
+        self.assertEqual(on_done.call_args.args[0].result(), 1024)
+
+    def test_session_ends_when_dialog_is_hidden(self):
+        """Test a job's session no longer matches once its dialog was closed"""
+        mock_dialog = Mock(session=0)
+        mock_dialog.winfo_exists.return_value = True
+        session = mock_dialog.session
+        self.assertTrue(user_interface.session_open(mock_dialog, session))
+
+        # Closing and reopening mid-job must not let the job hide the dialog
+        user_interface.hide_dialog(mock_dialog)
+        mock_dialog.on_hide.assert_called_once()
+        self.assertFalse(user_interface.session_open(mock_dialog, session))
+
+
+@unittest.skipIf(_SKIP_CRYPTO, "crypto tests skipped via env flag")
 class TestEncryptionDecryption(unittest.TestCase):
     """Test encryption and decryption operations"""
 
     def setUp(self):
         """Set up test environment"""
         self.test_dir = tempfile.mkdtemp()
-        self.original_dir = os.getcwd()
-        os.chdir(self.test_dir)
+        self.keys_dir = Path(self.test_dir)
 
         # Generate test RSA keys
         private_key, public_key, _ = main.generate_rsa_key_pair()
-        with open("public_key.pem", "w") as f:
-            f.write(public_key)
-        with open("private_key.pem", "w") as f:
-            f.write(private_key)
+        (self.keys_dir / "public_key.pem").write_text(public_key)
+        (self.keys_dir / "private_key.pem").write_text(private_key)
 
     def tearDown(self):
         """Clean up test environment"""
-        os.chdir(self.original_dir)
         import shutil
 
         if Path(self.test_dir).exists():
@@ -203,12 +371,16 @@ class TestEncryptionDecryption(unittest.TestCase):
         test_data = "Secret message for testing"
 
         # Encrypt
-        encrypted = main.encrypt_with_rsa_public_key(test_data)
+        encrypted = main.encrypt_with_rsa_public_key(
+            test_data, self.keys_dir / "public_key.pem"
+        )
         self.assertIsNotNone(encrypted)
         self.assertNotEqual(encrypted, test_data)
 
         # Decrypt
-        decrypted = main.decrypt_with_rsa_private_key(encrypted)
+        decrypted = main.decrypt_with_rsa_private_key(
+            encrypted, self.keys_dir / "private_key.pem"
+        )
         self.assertEqual(decrypted, test_data)
 
     def test_encrypt_decrypt_file_fernet(self):
@@ -230,22 +402,40 @@ class TestEncryptionDecryption(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(output_file.read_bytes(), test_content)
 
+        # Decrypt from the token as raw bytes, as the UI reads it
+        output_file.unlink()
+        result = main.decrypt_file_with_fernet(
+            encrypted_data.encode("ascii"), key, str(output_file)
+        )
+        self.assertTrue(result)
+        self.assertEqual(output_file.read_bytes(), test_content)
 
+        # Without an output name the file is named from the current timestamp;
+        # open is patched so nothing is written to the shared cwd
+        with (
+            patch("main.time.time", return_value=1234.5),
+            patch("main.open", mock_open(), create=True) as mocked_open,
+        ):
+            result = main.decrypt_file_with_fernet(encrypted_data, key)
+        self.assertTrue(result)
+        mocked_open.assert_called_once_with("decrypted_1234.bin", "wb")
+        mocked_open().write.assert_called_once_with(test_content)
+
+
+@unittest.skipIf(_SKIP_CRYPTO, "crypto tests skipped via env flag")
 class TestImportKeyFunctions(unittest.TestCase):
     """Test key import functions"""
 
     def setUp(self):
         """Set up test environment"""
         self.test_dir = tempfile.mkdtemp()
-        self.original_dir = os.getcwd()
-        os.chdir(self.test_dir)
+        self.keys_dir = Path(self.test_dir)
 
         # Generate valid test keys
         self.private_key, self.public_key, _ = main.generate_rsa_key_pair()
 
     def tearDown(self):
         """Clean up test environment"""
-        os.chdir(self.original_dir)
         import shutil
 
         if Path(self.test_dir).exists():
@@ -254,16 +444,21 @@ class TestImportKeyFunctions(unittest.TestCase):
     def test_import_external_rsa_keys(self):
         """Test importing external RSA keys"""
         result = main.import_external_rsa_keys(
-            private=self.private_key, public=self.public_key, passphrase=None
+            private=self.private_key,
+            public=self.public_key,
+            passphrase=None,
+            keys_dir=self.keys_dir,
         )
 
         self.assertTrue(result[0])
-        self.assertTrue(Path("public_key.pem").exists())
-        self.assertTrue(Path("private_key.pem").exists())
+        self.assertTrue((self.keys_dir / "public_key.pem").exists())
+        self.assertTrue((self.keys_dir / "private_key.pem").exists())
 
     def test_import_external_rsa_keys_empty(self):
         """Test importing with empty keys"""
-        result = main.import_external_rsa_keys(private="", public="")
+        result = main.import_external_rsa_keys(
+            private="", public="", keys_dir=self.keys_dir
+        )
         self.assertFalse(result[0])
 
     def test_import_keys_with_passphrase(self):
@@ -274,12 +469,16 @@ class TestImportKeyFunctions(unittest.TestCase):
         )
 
         result = main.import_external_rsa_keys(
-            private=private_key, public=public_key, passphrase="testpass123"
+            private=private_key,
+            public=public_key,
+            passphrase="testpass123",
+            keys_dir=self.keys_dir,
         )
 
         self.assertTrue(result[0])
 
 
+@unittest.skipIf(_SKIP_CRYPTO, "crypto tests skipped via env flag")
 class TestFormatKeyFunction(unittest.TestCase):
     """Test key formatting function"""
 
@@ -327,12 +526,15 @@ class TestMenuActionSimulation(unittest.TestCase):
         self.mock_info_text.tag_config = Mock()
 
         self.test_dir = tempfile.mkdtemp()
-        self.original_dir = os.getcwd()
-        os.chdir(self.test_dir)
+        self.keys_dir = Path(self.test_dir)
+
+        # Menu actions resolve keys through main.get_keys_directory()
+        keys_dir_patcher = patch("main.get_keys_directory", return_value=self.keys_dir)
+        keys_dir_patcher.start()
+        self.addCleanup(keys_dir_patcher.stop)
 
     def tearDown(self):
         """Clean up"""
-        os.chdir(self.original_dir)
         import shutil
 
         if Path(self.test_dir).exists():
@@ -350,29 +552,27 @@ class TestMenuActionSimulation(unittest.TestCase):
         # Manual testing required for GUI dialogs
         pass
 
+    @unittest.skipIf(_SKIP_CRYPTO, "generates an RSA key pair")
     def test_public_key_menu_action(self):
         """Test Public Key menu action"""
         # Generate and save test keys
         private_key, public_key, _ = main.generate_rsa_key_pair()
-        with open("public_key.pem", "w") as f:
-            f.write(public_key)
-        with open("private_key.pem", "w") as f:
-            f.write(private_key)
+        (self.keys_dir / "public_key.pem").write_text(public_key)
+        (self.keys_dir / "private_key.pem").write_text(private_key)
 
         user_interface.menu_action(self.mock_app, self.mock_info_text, "Public Key")
 
         # Verify info was updated
         self.mock_info_text.insert.assert_called()
 
+    @unittest.skipIf(_SKIP_CRYPTO, "generates an RSA key pair")
     @patch("user_interface.messagebox.showwarning")
     def test_private_key_menu_action(self, mock_warning):
         """Test Private Key menu action"""
         # Generate and save test keys
         private_key, public_key, _ = main.generate_rsa_key_pair()
-        with open("public_key.pem", "w") as f:
-            f.write(public_key)
-        with open("private_key.pem", "w") as f:
-            f.write(private_key)
+        (self.keys_dir / "public_key.pem").write_text(public_key)
+        (self.keys_dir / "private_key.pem").write_text(private_key)
 
         user_interface.menu_action(self.mock_app, self.mock_info_text, "Private Key")
 
@@ -381,24 +581,79 @@ class TestMenuActionSimulation(unittest.TestCase):
         # Verify info was updated
         self.mock_info_text.insert.assert_called()
 
+    def test_popup_positions_survive_child_configure(self):
+        """Test only the root's own <Configure> clears cached popup positions"""
+        app = Mock()
+        app._popup_positions = {"button": (10, 20)}
 
+        user_interface.App._forget_popup_positions(app, Mock(widget=Mock()))
+        self.assertEqual(app._popup_positions, {"button": (10, 20)})
+
+        user_interface.App._forget_popup_positions(app, Mock(widget=app))
+        self.assertEqual(app._popup_positions, {})
+
+    @patch("user_interface.messagebox.showerror")
+    def test_import_keys_rejects_short_keys(self, mock_error):
+        """Test pasted keys below the minimum length are rejected"""
+        public_box, private_box, passphrase_box = Mock(), Mock(), Mock()
+        public_box.get.return_value = "x" * 50
+        private_box.get.return_value = "y" * 600
+        passphrase_box.get.return_value = ""
+
+        with patch("main.import_external_rsa_keys") as mock_import:
+            user_interface.import_keys(
+                public_box, private_box, passphrase_box, self.mock_info_text, Mock()
+            )
+
+        mock_error.assert_called_once()
+        mock_import.assert_not_called()
+
+    @patch("user_interface.messagebox.showerror")
+    def test_import_keys_rejects_whitespace_padded_keys(self, mock_error):
+        """Test trailing blank lines cannot pad a short key past the minimum"""
+        public_box, private_box, passphrase_box = Mock(), Mock(), Mock()
+        public_box.get.return_value = "x" * 150 + "\n" * 100
+        private_box.get.return_value = "y" * 600
+        passphrase_box.get.return_value = ""
+
+        with patch("main.import_external_rsa_keys") as mock_import:
+            user_interface.import_keys(
+                public_box, private_box, passphrase_box, self.mock_info_text, Mock()
+            )
+
+        mock_error.assert_called_once()
+        self.assertIn("150 chars", mock_error.call_args.args[1])
+        mock_import.assert_not_called()
+
+
+@unittest.skipIf(_SKIP_CRYPTO, "crypto tests skipped via env flag")
 class TestMainFunctions(unittest.TestCase):
     """Test main.py functions directly"""
 
     def setUp(self):
         """Set up test environment"""
         self.test_dir = tempfile.mkdtemp()
-        self.original_dir = os.getcwd()
-        os.chdir(self.test_dir)
+        self.keys_dir = Path(self.test_dir)
 
     def tearDown(self):
         """Clean up test environment"""
-        os.chdir(self.original_dir)
         import shutil
 
         if Path(self.test_dir).exists():
             shutil.rmtree(self.test_dir)
 
+    def test_get_keys_directory_raises_when_unwritable(self):
+        """Test both the Documents and fallback key directories failing raises"""
+        not_a_dir = Path(self.test_dir) / "home_file"
+        not_a_dir.write_text("")
+
+        with (
+            patch.object(main, "_KEYS_DIR_CACHE", None),
+            patch("main.Path.home", return_value=not_a_dir),
+        ):
+            with self.assertRaises(OSError):
+                main.get_keys_directory()
+
     def test_generate_rsa_key_pair_no_passphrase(self):
         """Test RSA key pair generation without passphrase"""
         private_key, public_key, passphrase = main.generate_rsa_key_pair()
@@ -432,19 +687,17 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_retrieve_rsa_keys_not_found(self):
         """Test retrieving RSA keys when files don't exist"""
-        result = main.retrieve_rsa_keys()
+        result = main.retrieve_rsa_keys(keys_dir=self.keys_dir)
         self.assertFalse(result)
 
     def test_retrieve_rsa_keys_success(self):
         """Test retrieving RSA keys successfully"""
         # Generate and save keys
         private_key, public_key, _ = main.generate_rsa_key_pair()
-        with open("public_key.pem", "w") as f:
-            f.write(public_key)
-        with open("private_key.pem", "w") as f:
-            f.write(private_key)
+        (self.keys_dir / "public_key.pem").write_text(public_key)
+        (self.keys_dir / "private_key.pem").write_text(private_key)
 
-        result = main.retrieve_rsa_keys()
+        result = main.retrieve_rsa_keys(keys_dir=self.keys_dir)
         self.assertTrue(result[0])
         self.assertIsNotNone(result[1])
         self.assertIsNotNone(result[2])
@@ -466,6 +719,7 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestRSAKeyFunctions))
     suite.addTests(loader.loadTestsFromTestCase(TestInfoPanelFunctions))
     suite.addTests(loader.loadTestsFromTestCase(TestFileOperations))
+    suite.addTests(loader.loadTestsFromTestCase(TestBackgroundWork))
     suite.addTests(loader.loadTestsFromTestCase(TestEncryptionDecryption))
     suite.addTests(loader.loadTestsFromTestCase(TestImportKeyFunctions))
     suite.addTests(loader.loadTestsFromTestCase(TestFormatKeyFunction))
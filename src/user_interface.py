@@ -1,75 +1,238 @@
 import os
+import sys
 import json
+import subprocess
+import traceback
 from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache, partial
 import customtkinter
 import tkinter as tk
-from tkinter import messagebox, filedialog
-from cryptography.fernet import Fernet
+from tkinter import ttk, messagebox, filedialog
+
+try:
+    import orjson
+except ImportError:  # optional: faster settings parsing, stdlib json otherwise
+    orjson = None
+
+
+@cache
+def root_dir() -> Path:
+    """Directory containing this module, resolved on first use"""
+    return Path(__file__).parent.resolve()
+
+
+# Bind the crypto backend once instead of importing it inside every handler
+try:
+    import main as _main
+except ImportError:
+    # Launched from outside src/ (e.g. a frozen bundle): make siblings importable
+    sys.path.insert(0, str(root_dir()))
+    import main as _main
+
+BLUE = "#1f6aa5"
+DARK_BLUE = "#144870"
+LIGHT_BLUE = "#4a9eff"
+RED = "#c91658"
+BLACK = "#0d0c0d"
+RESET = "#ffffff"
+
+# Shared CTkButton style for dialog action buttons
+_DIALOG_BTN = {"fg_color": LIGHT_BLUE, "hover_color": DARK_BLUE}
+
+# Native ttk colors for the main window, matching CTk's default blue theme
+_NATIVE_PALETTE = {
+    "light": {
+        "window": "#EBEBEB",
+        "panel": "#DBDBDB",
+        "text_bg": "#F9F9F9",
+        "text": BLACK,
+    },
+    "dark": {
+        "window": "#242424",
+        "panel": "#2B2B2B",
+        "text_bg": "#1D1E1E",
+        "text": "#FFFFFF",
+    },
+}
+
+# Default info-panel text color for the current appearance mode; see refresh_info_color
+_DEFAULT_INFO_COLOR: str | None = None
+
+# Info-panel writes queued by post_info, keyed by widget: (content, color)
+_PENDING_INFO: dict[tk.Text, tuple[str, str | None]] = {}
+
+# keys dir -> (PEM file stamp, private key, public key) from the last read
+_RSA_KEYS_CACHE: dict[Path, tuple] = {}
+
+# Separator rules for info-panel reports
+SEP50 = "=" * 50
+SEP40 = "-" * 40
+
+# Smallest plausible PEM sizes for pasted keys
+MIN_PUBLIC_KEY_CHARS = 200
+MIN_PRIVATE_KEY_CHARS = 500
+
+# Welcome text for the information panel, one entry per paragraph
+_WELCOME_PARAGRAPHS = (
+    "Welcome to TinyEncryptor!\n\n",
+    (
+        "This application provides secure encryption and\n"
+        "decryption capabilities using industry-standard\n"
+        "algorithms.\n\n"
+    ),
+    (
+        "Features:\n"
+        "• RSA Encryption: Asymmetric encryption for secure key exchange\n"
+        "• Fernet Encryption: Symmetric encryption for fast file encryption\n"
+        "• Key Management: Generate, import, and manage encryption keys\n"
+        "• File Processing: Encrypt/decrypt data or files with ease\n\n"
+    ),
+    (
+        "Instructions:\n"
+        "1. Generate or import RSA keys first\n"
+        "2. Choose encryption method\n"
+        "3. Select files to process\n"
+        "4. Save or share encrypted files securely\n"
+        "5. Maintain Multiple RSA Key Pairs for different use cases\n\n"
+    ),
+    (
+        "Decryption Process:\n"
+        "1. Enter or select the encrypted data/file\n"
+        "2. Provide the correct key/passphrase\n"
+        "3. Save the decrypted output securely\n\n"
+    ),
+    (
+        "Security Notice:\n"
+        "Keep your private keys secure and never share them. "
+        "Always backup your keys in a safe location."
+    ),
+)
+
+# Dropdown entries for each main menu button; read-only and built once
+_DROPDOWN_MAP = MappingProxyType(
+    {
+        "Import RSA Key": ("RSA Key Data", "RSA Key File"),
+        "Generate RSA Key Pair": ("2048-bit", "3072-bit", "4096-bit"),
+        "Display the RSA Keys": ("Public Key", "Private Key"),
+        "Encrypt/Decrypt": (
+            "Encrypt Data",
+            "Encrypt File",
+            "Decrypt Data",
+            "Decrypt File",
+        ),
+        "Settings": ("Theme", "Security", "Paths"),
+        "Help": ("User Guide", "FAQ", "About"),
+    }
+)
+
+# Worker pool for blocking crypto and file work, so the Tk mainloop keeps painting
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+_POLL_MS = 50
+
+# customtkinter re-checks the OS appearance mode every 30 ms by default, which
+# keeps an idle window waking ~33 times a second; a theme flip can wait longer
+_APPEARANCE_POLL_MS = 500
+
+# Shared CTkFont instances keyed by (size, weight); built on first use
+_FONT_CACHE: dict[tuple[int, str], customtkinter.CTkFont] = {}
 
 
-ROOT_DIR = Path(__file__).parent.resolve()
-BLUE = f"{'#1f6aa5'}"
-DARK_BLUE = f"{'#144870'}"
-LIGHT_BLUE = f"{'#4a9eff'}"
-RED = f"{'#c91658'}"
-BLACK = f"{'#0d0c0d'}"
-RESET = f"{'#ffffff'}"
+def _font(size: int, weight: str = "normal") -> customtkinter.CTkFont:
+    """Return a cached CTkFont so dialogs don't allocate a new Tk font per widget"""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = customtkinter.CTkFont(size=size, weight=weight)
+    return font
 
 
 def get_keys_directory() -> Path:
-    """Get a user-writable directory for storing encryption keys.
-    Returns a Path object to ~/Documents/TinyEncryptor_Keys/
-    Creates the directory if it doesn't exist.
-    """
-    # Use Documents folder which is always writable
-    keys_dir = Path.home() / "Documents" / "TinyEncryptor_Keys"
+    """Get the user-writable keys directory (cached by the backend)"""
+    return _main.get_keys_directory()
 
-    # Create directory if it doesn't exist
-    try:
-        keys_dir.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        print(f"Warning: Could not create keys directory at {keys_dir}: {e}")
-        # Fallback to home directory if Documents is not accessible
-        keys_dir = Path.home() / ".tinyencryptor_keys"
-        keys_dir.mkdir(parents=True, exist_ok=True)
 
-    return keys_dir
+DEFAULT_SETTINGS = {
+    "theme": "System",  # Default theme
+}
 
+# Settings file override; None means settings.json in the keys directory
+SETTINGS_FILE: Path | None = None
 
-def load_settings() -> dict:
-    """Load settings from JSON file, return default settings if file doesn't exist"""
-    default_settings = {
-        "theme": "System",  # Default theme
-    }
+# (settings file, merged settings) from the last load or save
+_SETTINGS_CACHE: tuple[Path, dict] | None = None
+
+
+def _settings_loads(data: bytes) -> dict:
+    return orjson.loads(data) if orjson else json.loads(data)
 
+
+def _settings_dumps(settings: dict) -> bytes:
+    if orjson:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2).encode("utf-8")
+
+
+def _settings_file() -> Path:
     # Use the same directory as keys for settings
-    settings_file = get_keys_directory() / "settings.json"
+    return SETTINGS_FILE or get_keys_directory() / "settings.json"
+
+
+def invalidate_settings_cache() -> None:
+    """Forget cached settings so the next load re-reads settings.json"""
+    global _SETTINGS_CACHE
+    _SETTINGS_CACHE = None
+
+
+def load_settings() -> dict:
+    """Load settings from JSON file, return default settings if file doesn't exist
+    The file is parsed once; later calls return a copy of the cached settings.
+    """
+    global _SETTINGS_CACHE
+    settings_file = _settings_file()
+    if _SETTINGS_CACHE is not None and _SETTINGS_CACHE[0] == settings_file:
+        return dict(_SETTINGS_CACHE[1])
 
     try:
         if settings_file.exists():
-            with open(settings_file, "r") as f:
-                settings = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                return {**default_settings, **settings}
-        return default_settings
+            settings = _settings_loads(settings_file.read_bytes())
+            # Merge with defaults to ensure all keys exist
+            merged = {**DEFAULT_SETTINGS, **settings}
+        else:
+            merged = dict(DEFAULT_SETTINGS)
     except Exception as e:
         print(f"Error loading settings: {e}")
-        return default_settings
+        return dict(DEFAULT_SETTINGS)
+
+    _SETTINGS_CACHE = (settings_file, merged)
+    return dict(merged)
 
 
 def save_settings(settings: dict) -> bool:
-    """Save settings to JSON file"""
-    # Use the same directory as keys for settings
-    settings_file = get_keys_directory() / "settings.json"
+    """Save settings to JSON file and refresh the settings cache
+    Unchanged settings are not rewritten; changed ones replace the file atomically.
+    """
+    global _SETTINGS_CACHE
+    settings_file = _settings_file()
+    merged = {**DEFAULT_SETTINGS, **settings}
+
+    if (
+        _SETTINGS_CACHE is not None
+        and _SETTINGS_CACHE == (settings_file, merged)
+        and settings_file.exists()
+    ):
+        return True
 
     try:
-        with open(settings_file, "w") as f:
-            json.dump(settings, f, indent=4)
-        return True
+        atomic_write_bytes(settings_file, _settings_dumps(settings))
     except Exception as e:
         print(f"Error saving settings: {e}")
         return False
 
+    _SETTINGS_CACHE = (settings_file, merged)
+    return True
+
 
 class App(customtkinter.CTk):
     def __init__(
@@ -110,6 +273,12 @@ class App(customtkinter.CTk):
         self.button_label = button_label
         # Define dropdown items for each main button
         self.dropdown_map = dropdown_map
+        # Dropdown menus built once from dropdown_map
+        self.menus: dict[str, tk.Menu] = {}
+        # Screen position under each dropdown button, measured on first click.
+        # Any <Configure> (window move/resize or relayout) invalidates it.
+        self._popup_positions: dict[tk.Widget, tuple[int, int]] = {}
+        self.bind("<Configure>", self._forget_popup_positions, add="+")
         # Buttons with blue shadow effect
         self.buttons_data = buttons_data
         # Information panel in right frame
@@ -119,36 +288,91 @@ class App(customtkinter.CTk):
         self.description = description
         self.info_content = info_content
 
-    def show_dropdown(
-        self, parent, anchor_widget: tk.Widget, items: list[str], menu_action_callback
-    ):
-        """Show a native Tk dropdown menu anchored to a widget"""
-        menu = tk.Menu(parent, tearoff=0)
-        for item in items:
-            menu.add_command(
-                label=item, command=lambda val=item: menu_action_callback(val)
+    def show_dropdown(self, anchor_widget: tk.Widget, menu: tk.Menu):
+        """Pop up a pre-built native Tk menu just under the anchor widget"""
+        position = self._popup_positions.get(anchor_widget)
+        if position is None:
+            position = self._popup_positions[anchor_widget] = (
+                anchor_widget.winfo_rootx(),
+                anchor_widget.winfo_rooty() + anchor_widget.winfo_height(),
             )
-        # Position menu just under the anchor widget
-        x = anchor_widget.winfo_rootx()
-        y = anchor_widget.winfo_rooty() + anchor_widget.winfo_height()
+        x, y = position
         try:
             menu.tk_popup(x, y)
         finally:
             menu.grab_release()
 
-    def on_button_click(self, event, txt, btn):
-        self.items = self.dropdown_map.get(txt)
-        if self.items:
-            self.show_dropdown(
-                self,
-                btn,
-                self.items,
-                lambda val: menu_action(self, self.info_text, val),
-            )
+    def _forget_popup_positions(self, event=None):
+        # <Configure> on the root also fires for every descendant (menus,
+        # the text panel); only the window itself moving or resizing matters
+        if event is not None and event.widget is not self:
+            return
+        self._popup_positions.clear()
+
+    def _set_appearance_mode(self, mode_string: str):
+        # customtkinter recolors only CTk widgets, including when the OS flips
+        # the "System" theme; restyle the native main window along with them
+        super()._set_appearance_mode(mode_string)
+        style_native_widgets(self)
+
+    def on_button_click(self, txt, btn):
+        """Open txt's dropdown under btn, or run txt directly if it has none"""
+        menu = self.menus.get(txt)
+        if menu is not None:
+            self.show_dropdown(btn, menu)
         else:
             menu_action(self, self.info_text, txt)
 
 
+def build_menu(parent, items: tuple[str, ...], menu_action_callback) -> tk.Menu:
+    """Build a native Tk dropdown menu once so it can be re-shown on every click"""
+    menu = tk.Menu(parent, tearoff=0)
+    for item in items:
+        menu.add_command(label=item, command=partial(menu_action_callback, item))
+    return menu
+
+
+def show_cached_dialog(app, attr: str, title: str, geometry: str):
+    """Show the modal dialog cached on app under attr, creating it on first use
+    Returns (dialog, created); callers build their widgets only when created
+    is True. Closing the window hides it instead of destroying it, and every
+    hide starts a new session (see session_open).
+    """
+    dialog = getattr(app, attr, None)
+    if dialog is not None and dialog.winfo_exists():
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        return dialog, False
+
+    dialog = customtkinter.CTkToplevel(app)
+    dialog.title(title)
+    dialog.geometry(geometry)
+    dialog.protocol("WM_DELETE_WINDOW", partial(hide_dialog, dialog))
+    dialog.grab_set()
+    dialog.session = 0
+    setattr(app, attr, dialog)
+    return dialog, True
+
+
+def hide_dialog(dialog):
+    """Withdraw a cached dialog, running its on_hide cleanup if it has one"""
+    on_hide = getattr(dialog, "on_hide", None)
+    if on_hide is not None:
+        on_hide()
+    dialog.session += 1
+    dialog.grab_release()
+    dialog.withdraw()
+
+
+def session_open(dialog, session: int) -> bool:
+    """Return True if dialog still shows the session read before a background job
+    A dialog closed and reopened while the job ran holds the user's new input,
+    so the job's completion must not hide or clear it.
+    """
+    return dialog.winfo_exists() and dialog.session == session
+
+
 def display_message_dialog(parent, title: str, message: str):
     """Display a message in a dialog window"""
     msg_dialog = customtkinter.CTkToplevel(parent)
@@ -158,7 +382,7 @@ def display_message_dialog(parent, title: str, message: str):
 
     # Message textbox
     message_text = customtkinter.CTkTextbox(
-        msg_dialog, width=750, font=customtkinter.CTkFont(size=11), wrap="word"
+        msg_dialog, width=750, font=_font(11), wrap="word"
     )
     message_text.pack(pady=20, padx=20, fill="both", expand=True)
     message_text.insert("1.0", message)
@@ -168,19 +392,87 @@ def display_message_dialog(parent, title: str, message: str):
     close_btn = customtkinter.CTkButton(
         msg_dialog,
         text="Close",
-        font=customtkinter.CTkFont(size=14, weight="bold"),
+        font=_font(14, "bold"),
         command=msg_dialog.destroy,
-        fg_color=LIGHT_BLUE,
-        hover_color=DARK_BLUE
+        **_DIALOG_BTN,
     )
     close_btn.pack(pady=20)
 
 
+# Keys that still work in the read-only info panel: navigation, plus the
+# selection and copy shortcuts when Control or Command is held
+_READ_ONLY_NAV_KEYS = frozenset(
+    ("Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next")
+)
+_READ_ONLY_SHORTCUT_KEYS = frozenset(("c", "C", "a", "A", "slash", "Insert"))
+_SHORTCUT_STATE_MASK = 0x4 | 0x8  # Control | Mod1 (Command on macOS)
+
+
+def _read_only_key(event):
+    if event.keysym in _READ_ONLY_NAV_KEYS:
+        return None
+    if event.state & _SHORTCUT_STATE_MASK and event.keysym in _READ_ONLY_SHORTCUT_KEYS:
+        return None
+    return "break"
+
+
+def make_read_only(info_text) -> None:
+    """Make a tk.Text read-only without toggling its state on every update
+    Typing, cutting and pasting are swallowed by widget bindings, which run
+    before the Text class bindings; selecting and copying still work.
+    """
+    info_text.bind("<Key>", _read_only_key)
+    for virtual in ("<<Cut>>", "<<Paste>>", "<<PasteSelection>>", "<<Clear>>"):
+        info_text.bind(virtual, lambda event: "break")
+
+
+def _set_wrap(info_text, wrap: str) -> None:
+    # Reconfiguring wrap relays out the whole widget; only do it on a change
+    if info_text.cget("wrap") != wrap:
+        info_text.configure(wrap=wrap)
+
+
 def clear_info(info_text):
     """Clear the information panel"""
-    info_text.configure(state="normal")
+    _PENDING_INFO.pop(info_text, None)
     info_text.delete("1.0", "end")
-    info_text.configure(state="disabled")
+
+
+def refresh_info_color() -> str:
+    """Recompute the default info-panel text color for the current appearance mode"""
+    global _DEFAULT_INFO_COLOR
+    if customtkinter.get_appearance_mode().lower() == "dark":
+        _DEFAULT_INFO_COLOR = "#FFFFFF"  # White text for dark mode
+    else:
+        _DEFAULT_INFO_COLOR = BLACK  # Black text for light mode
+    return _DEFAULT_INFO_COLOR
+
+
+def _info_color(color: str = None) -> str:
+    """Return the given color, or a theme-appropriate default text color"""
+    # Auto-detect appropriate text color based on theme if not specified
+    if color is None:
+        color = _DEFAULT_INFO_COLOR or refresh_info_color()
+    return color
+
+
+def _color_tag(info_text, color: str) -> str:
+    """Return the tag name for color, configuring the tag only if it isn't yet"""
+    tag_name = f"color_{color.replace('#', '')}"
+    try:
+        configured = info_text.tag_cget(tag_name, "foreground") == color
+    except tk.TclError:
+        # Tk raises for a tag that has never been created
+        configured = False
+    if not configured:
+        info_text.tag_config(tag_name, foreground=color)
+    return tag_name
+
+
+def init_color_tags(info_text) -> None:
+    """Register the info panel's color tags once, when the panel is built"""
+    for color in ("#FFFFFF", BLACK, RED):
+        _color_tag(info_text, color)
 
 
 def set_info(
@@ -193,25 +485,140 @@ def set_info(
     """Set content in the information panel with custom formatting
     Note: bold and italic parameters are not used due to customtkinter limitations
     """
-    # Auto-detect appropriate text color based on theme if not specified
-    if color is None:
-        current_mode = customtkinter.get_appearance_mode()
-        if current_mode.lower() == "dark":
-            color = "#FFFFFF"  # White text for dark mode
-        else:
-            color = BLACK  # Black text for light mode
+    _PENDING_INFO.pop(info_text, None)
+    color = _info_color(color)
 
-    info_text.configure(state="normal")
+    _set_wrap(info_text, "char")
     info_text.delete("1.0", "end")
     info_text.insert("1.0", content)
 
     # Apply color formatting using tags with dynamic tag names based on color
-    tag_name = f"color_{color.replace('#', '')}"
+    tag_name = _color_tag(info_text, color)
     info_text.tag_add(tag_name, "1.0", "end")
+
+
+def post_info(info_text, content: str, color: str = None) -> None:
+    """Queue content for the information panel, written on the next idle cycle
+    A burst of posts collapses into a single write of the last one. A direct
+    set_info before the flush wins, so later synchronous updates are never
+    overwritten by a stale queued message.
+    """
+    already_queued = info_text in _PENDING_INFO
+    _PENDING_INFO[info_text] = (content, color)
+    if not already_queued:
+        info_text.after_idle(_flush_info, info_text)
+
+
+def _flush_info(info_text):
+    pending = _PENDING_INFO.pop(info_text, None)
+    if pending is not None:
+        set_info(info_text, *pending)
+
+
+def set_info_chunks(info_text, parts, color: str = None, wrap: str = "char"):
+    """Set content in the information panel from a sequence of text fragments
+    Each fragment is appended with its own insert, so large key dumps are never
+    concatenated into one intermediate string. PEM blocks are
+    already wrapped at 64 columns, so key dumps pass wrap="none" to skip Tk's
+    line-wrap pass.
+    """
+    _PENDING_INFO.pop(info_text, None)
+    color = _info_color(color)
+    tag_name = _color_tag(info_text, color)
+
+    _set_wrap(info_text, wrap)
+    info_text.delete("1.0", "end")
+    for part in parts:
+        info_text.insert("end", part, tag_name)
+
+
+def insert_colored_line(info_text, line: int, text: str, color: str, tag_name: str):
+    """Insert text as a new line before line number `line` and color it"""
+    start = f"{line}.0"
+    info_text.insert(start, text + "\n")
+    info_text.tag_add(tag_name, start, f"{line + 1}.0")
     info_text.tag_config(tag_name, foreground=color)
+
+
+def set_lines(info_text, header: str, lines):
+    """Replace a textbox's content with an optional header and one item per line
+    The text goes in with a single insert; per-line inserts cost one Tcl call
+    each, which dominates for selections of hundreds of files.
+    """
+    text = "".join(f"{line}\n" for line in lines)
+    if header:
+        text = header + "\n" + text
+    info_text.configure(state="normal")
+    info_text.delete("1.0", "end")
+    info_text.insert("end", text)
     info_text.configure(state="disabled")
 
 
+def debounced(widget, ms: int, fn):
+    """Return a trigger that runs fn once, ms milliseconds after the last call
+    in a burst, so per-keystroke events coalesce into a single check.
+    """
+    pending = [None]
+
+    def run():
+        pending[0] = None
+        fn()
+
+    def trigger(*_args):
+        if pending[0] is not None:
+            widget.after_cancel(pending[0])
+        pending[0] = widget.after(ms, run)
+
+    return trigger
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a temp file next to path, then rename it over path
+    A crash mid-write never leaves a truncated file behind. The rename would
+    otherwise drop path's permissions, so an existing file's mode is carried
+    over; new files are created owner-only (0600), since these may be keys.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o600
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # O_CREAT's mode is ignored for a leftover temp file; set it explicitly
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_key_files(*files: tuple[Path, str]) -> None:
+    """Write PEM files atomically in binary mode, skipping newline translation"""
+    for path, pem in files:
+        atomic_write_bytes(path, pem.encode("ascii"))
+
+
+def run_in_background(widget, on_done, fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) on the worker pool and call on_done(future) on
+    the Tk thread once it finishes. Tk is not thread-safe, so completion is
+    picked up by polling with widget.after() instead of from the worker.
+    """
+    future = _EXECUTOR.submit(fn, *args, **kwargs)
+
+    def poll():
+        if future.done():
+            on_done(future)
+        else:
+            widget.after(_POLL_MS, poll)
+
+    widget.after(_POLL_MS, poll)
+    return future
+
+
 def ask_passphrase() -> str | None:
     """Ask user for passphrase"""
     dialog = customtkinter.CTkInputDialog(
@@ -228,11 +635,63 @@ def choose_files(multiple: bool = True) -> list[str]:
     return [sel] if sel else []
 
 
-def retrieve_rsa_keys(type: str) -> str:
-    """Retrieve RSA keys from files"""
-    import main
+def open_directory(path) -> None:
+    """Open path in the platform file manager without waiting on it"""
+    path = str(path)
+    if sys.platform == "win32":
+        os.startfile(path)
+    elif sys.platform == "darwin":
+        subprocess.Popen(["/usr/bin/open", path], start_new_session=True)
+    else:  # Linux and others
+        subprocess.Popen(["xdg-open", path], start_new_session=True)
+
+
+def _rsa_key_stamp(keys_dir: Path) -> tuple:
+    # (mtime, size) of both PEM files; raises OSError if either is missing
+    private_stat = (keys_dir / "private_key.pem").stat()
+    public_stat = (keys_dir / "public_key.pem").stat()
+    return (
+        private_stat.st_mtime_ns,
+        private_stat.st_size,
+        public_stat.st_mtime_ns,
+        public_stat.st_size,
+    )
 
-    result = main.retrieve_rsa_keys()
+
+def get_cached_rsa_keys(keys_dir: Path | None = None) -> tuple:
+    """Return _main.retrieve_rsa_keys() for keys_dir, reusing the last read
+    while neither PEM file has changed on disk
+    """
+    keys_dir = Path(keys_dir) if keys_dir else get_keys_directory()
+    try:
+        stamp = _rsa_key_stamp(keys_dir)
+    except OSError:
+        # Missing key files: let the backend report it
+        _RSA_KEYS_CACHE.pop(keys_dir, None)
+        return _main.retrieve_rsa_keys(keys_dir=keys_dir)
+
+    cached = _RSA_KEYS_CACHE.get(keys_dir)
+    if cached is not None and cached[0] == stamp:
+        return True, cached[1], cached[2]
+
+    result = _main.retrieve_rsa_keys(keys_dir=keys_dir)
+    if result and result[0]:
+        _RSA_KEYS_CACHE[keys_dir] = (stamp, result[1], result[2])
+    return result
+
+
+def remember_rsa_keys(keys_dir: Path, private_key: str, public_key: str) -> None:
+    """Seed the key cache with keys just written to keys_dir"""
+    keys_dir = Path(keys_dir)
+    try:
+        _RSA_KEYS_CACHE[keys_dir] = (_rsa_key_stamp(keys_dir), private_key, public_key)
+    except OSError:
+        _RSA_KEYS_CACHE.pop(keys_dir, None)
+
+
+def retrieve_rsa_keys(type: str, keys_dir: Path | None = None) -> str:
+    """Retrieve RSA keys from files"""
+    result = get_cached_rsa_keys(keys_dir)
 
     if result and result[0]:
         _, private_key, public_key = result
@@ -242,41 +701,51 @@ def retrieve_rsa_keys(type: str) -> str:
 
 
 def import_keys(
-    public_key_text, private_key_text, passphrase_text, info_text, key_dialog
+    public_key_text,
+    private_key_text,
+    passphrase_text,
+    info_text,
+    key_dialog,
+    mirror: dict | None = None,
 ):
-    """Import RSA keys from text widgets"""
-    public_key = public_key_text.get("1.0", "end").strip()
-    private_key = private_key_text.get("1.0", "end").strip()
+    """Import RSA keys from text widgets
+    mirror maps a textbox to its last-read raw text; widgets with an
+    up-to-date entry are not read back through Tk again.
+    """
+    mirror = mirror or {}
+    public_key = mirror.get(public_key_text)
+    if public_key is None:
+        public_key = public_key_text.get("1.0", "end-1c")
+    private_key = mirror.get(private_key_text)
+    if private_key is None:
+        private_key = private_key_text.get("1.0", "end-1c")
     passphrase = passphrase_text.get("1.0", "end").strip()
 
+    public_key = public_key.strip()
+    private_key = private_key.strip()
+
     if not public_key or not private_key:
         messagebox.showerror("Error", "Both public and private keys are required!")
         return
 
     # Validate minimum lengths
-    if len(public_key) < 200:
+    if len(public_key) < MIN_PUBLIC_KEY_CHARS:
         messagebox.showerror(
             "Error",
-            f"Public key seems to short ({len(public_key)} chars). Expected at least 200 characters.",
+            f"Public key seems to short ({len(public_key)} chars). Expected at least {MIN_PUBLIC_KEY_CHARS} characters.",
         )
         return
 
-    if len(private_key) < 500:
+    if len(private_key) < MIN_PRIVATE_KEY_CHARS:
         messagebox.showerror(
             "Error",
-            f"Private key seems to short ({len(private_key)} chars). Expected at least 500 characters.",
+            f"Private key seems to short ({len(private_key)} chars). Expected at least {MIN_PRIVATE_KEY_CHARS} characters.",
         )
         return
 
-    # Import main module to access import function
     try:
-        import sys
-
-        sys.path.insert(0, str(ROOT_DIR))
-        import main
-
         # Call the import function from main.py with passphrase if provided
-        result = main.import_external_rsa_keys(
+        result = _main.import_external_rsa_keys(
             private=private_key,
             public=public_key,
             passphrase=passphrase if passphrase else None,
@@ -289,7 +758,7 @@ def import_keys(
                 info_text,
                 f"✓ RSA keys imported and saved{os.linesep}Public Key: {len(public_key)} chars{os.linesep}Private Key: {len(private_key)} chars{passphrase_info}",
             )
-            key_dialog.destroy()
+            hide_dialog(key_dialog)
         else:
             error_msg = "Failed to import keys. Please check:\n"
             error_msg += "• Keys are in valid format\n"
@@ -297,8 +766,6 @@ def import_keys(
             error_msg += "• No extra text mixed with key data"
             messagebox.showerror("Import Failed", error_msg)
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         print(f"Import error details:\n{error_details}")
         messagebox.showerror(
@@ -306,503 +773,520 @@ def import_keys(
         )
 
 
-def menu_action(app, info_text, choice: str):
-    """Handler for dropdown selections and Exit"""
-    if choice == "Exit":
-        app.destroy()
-        return
-    if choice == "RSA Key Data":
-        clear_info(info_text)
-        set_info(info_text, "Import RSA key: paste keys in the dialog.")
-
-        # Create a dialog window for pasting RSA keys
-        key_dialog = customtkinter.CTkToplevel(app)
-        key_dialog.title("Import RSA Keys")
-        key_dialog.geometry("700x600")
-        key_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            key_dialog,
-            text="Paste your RSA keys below (base64 format or PEM format)\nExtra spaces and newlines will be automatically cleaned up",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        instructions.pack(pady=(20, 10))
+def _handle_exit(app, info_text):
+    """Close the application"""
+    app.destroy()
 
-        # Public Key section
-        pub_label = customtkinter.CTkLabel(
-            key_dialog,
-            text="Public Key:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        pub_label.pack(pady=(10, 5), anchor="w", padx=20)
 
-        public_key_text = customtkinter.CTkTextbox(
-            key_dialog, height=150, width=650, font=customtkinter.CTkFont(size=11)
-        )
-        public_key_text.pack(pady=5, padx=20)
+def _handle_rsa_key_data(app, info_text):
+    """Import RSA keys pasted into a dialog"""
+    post_info(info_text, "Import RSA key: paste keys in the dialog.")
 
-        # Private Key section
-        priv_label = customtkinter.CTkLabel(
-            key_dialog,
-            text="Private Key:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        priv_label.pack(pady=(10, 5), anchor="w", padx=20)
+    key_dialog, created = show_cached_dialog(
+        app, "_import_dialog", "Import RSA Keys", "700x640"
+    )
+    if not created:
+        return
 
-        private_key_text = customtkinter.CTkTextbox(
-            key_dialog, height=150, width=650, font=customtkinter.CTkFont(size=11)
-        )
-        private_key_text.pack(pady=5, padx=20)
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        key_dialog,
+        text="Paste your RSA keys below (base64 format or PEM format)\nExtra spaces and newlines will be automatically cleaned up",
+        font=_font(14, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
 
-        passphrase_label = customtkinter.CTkLabel(
-            key_dialog,
-            text="(Optional) If your private key is encrypted, please provide the passphrase below.",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            height=1,
-            width=650,
-        )
-        passphrase_label.pack(pady=(10, 5), anchor="w", padx=20)
-        passphrase_text = customtkinter.CTkTextbox(
-            key_dialog, height=10, width=650, font=customtkinter.CTkFont(size=11)
-        )
-        passphrase_text.pack(pady=5, padx=20)
+    # Public Key section
+    pub_label = customtkinter.CTkLabel(
+        key_dialog,
+        text="Public Key:",
+        font=_font(14, "bold"),
+    )
+    pub_label.pack(pady=(10, 5), anchor="w", padx=20)
 
-        # Import button
-        import_btn = customtkinter.CTkButton(
-            key_dialog,
-            text="Import Keys",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=lambda: import_keys(
-                public_key_text,
-                private_key_text,
-                passphrase_text,
-                info_text,
-                key_dialog,
-            ),
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        import_btn.pack(pady=20)
+    public_key_text = customtkinter.CTkTextbox(
+        key_dialog, height=150, width=650, font=_font(11)
+    )
+    public_key_text.pack(pady=5, padx=20)
 
-        return
-    if choice == "RSA Key File":
-        clear_info(info_text)
+    # Private Key section
+    priv_label = customtkinter.CTkLabel(
+        key_dialog,
+        text="Private Key:",
+        font=_font(14, "bold"),
+    )
+    priv_label.pack(pady=(10, 5), anchor="w", padx=20)
 
-        # Import main module to access key retrieval function
-        import main
+    private_key_text = customtkinter.CTkTextbox(
+        key_dialog, height=150, width=650, font=_font(11)
+    )
+    private_key_text.pack(pady=5, padx=20)
 
-        # Check if key files exist and retrieve them
-        result = main.retrieve_rsa_keys()
+    # Live length feedback for pasted keys
+    validation_label = customtkinter.CTkLabel(
+        key_dialog, text="", font=_font(12), height=20
+    )
+    validation_label.pack(anchor="w", padx=20)
+
+    # Raw text of each key box as of its last edit burst; an entry is
+    # dropped as soon as the box changes again, so it is never stale
+    key_mirror = {}
+
+    def validate_lengths():
+        if not key_dialog.winfo_exists():
+            return
+        for box in (public_key_text, private_key_text):
+            if box not in key_mirror:
+                key_mirror[box] = box.get("1.0", "end-1c")
+        # Measure what import_keys will check: the text without padding
+        public_len = len(key_mirror[public_key_text].strip())
+        private_len = len(key_mirror[private_key_text].strip())
+        problems = []
+        if public_len and public_len < MIN_PUBLIC_KEY_CHARS:
+            problems.append(
+                f"public key too short ({public_len}/{MIN_PUBLIC_KEY_CHARS})"
+            )
+        if private_len and private_len < MIN_PRIVATE_KEY_CHARS:
+            problems.append(
+                f"private key too short ({private_len}/{MIN_PRIVATE_KEY_CHARS})"
+            )
+        if problems:
+            validation_label.configure(text="⚠️ " + "; ".join(problems), text_color=RED)
+        elif public_len or private_len:
+            validation_label.configure(
+                text=f"Public key: {public_len} chars | Private key: {private_len} chars",
+                text_color=_info_color(),
+            )
+        else:
+            validation_label.configure(text="")
+
+    # Check once per typing/paste burst rather than on every keystroke
+    check_lengths = debounced(key_dialog, 250, validate_lengths)
+
+    def on_key_text_modified(box):
+        # <<Modified>> only fires when the flag flips, so re-arm it here
+        if box.edit_modified():
+            box.edit_modified(False)
+            key_mirror.pop(box, None)
+            check_lengths()
+
+    for key_text in (public_key_text, private_key_text):
+        key_text.bind("<<Modified>>", lambda e, box=key_text: on_key_text_modified(box))
+
+    passphrase_label = customtkinter.CTkLabel(
+        key_dialog,
+        text="(Optional) If your private key is encrypted, please provide the passphrase below.",
+        font=_font(14, "bold"),
+        height=1,
+        width=650,
+    )
+    passphrase_label.pack(pady=(10, 5), anchor="w", padx=20)
+    passphrase_text = customtkinter.CTkTextbox(
+        key_dialog, height=10, width=650, font=_font(11)
+    )
+    passphrase_text.pack(pady=5, padx=20)
+
+    # Import button
+    import_btn = customtkinter.CTkButton(
+        key_dialog,
+        text="Import Keys",
+        font=_font(14, "bold"),
+        command=lambda: import_keys(
+            public_key_text,
+            private_key_text,
+            passphrase_text,
+            info_text,
+            key_dialog,
+            key_mirror,
+        ),
+        **_DIALOG_BTN,
+    )
+    import_btn.pack(pady=20)
 
-        if result and result[0]:
-            _, private_key, public_key = result
+    def clear_fields():
+        # Don't keep pasted keys or the passphrase in a hidden window
+        for box in (public_key_text, private_key_text, passphrase_text):
+            box.delete("1.0", "end")
+        key_mirror.clear()
+        validation_label.configure(text="")
 
-            # Display both keys in the info panel
-            display_text = "✓ Keys are existing\n\n"
-            display_text += "=== PUBLIC KEY ===\n"
-            display_text += public_key + "\n\n"
-            display_text += "=== PRIVATE KEY (Keep this secret!) ===\n"
-            display_text += private_key
+    key_dialog.on_hide = clear_fields
 
-            set_info(info_text, display_text)
-        else:
-            set_info(
-                info_text,
-                "❌ Key files not found. Please generate or import keys first.",
-            )
 
-        return
-    if choice in {"2048-bit", "3072-bit", "4096-bit"}:
-        clear_info(info_text)
-        set_info(info_text, f"Generate RSA key pair ({choice})")
-
-        # Import main module
-        # import main
-
-        # Create a dialog for key generation with optional passphrase
-        gen_dialog = customtkinter.CTkToplevel(app)
-        gen_dialog.title(f"Generate {choice} RSA Key Pair")
-        gen_dialog.geometry("700x600")
-        gen_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            gen_dialog,
-            text=f"Generate {choice} RSA Key Pair\nEnter an optional passphrase to encrypt the private key",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        instructions.pack(pady=(20, 10))
+def _handle_rsa_key_file(app, info_text):
+    """Show the RSA keys stored in the keys directory"""
+    # Check if key files exist and retrieve them
+    result = get_cached_rsa_keys()
 
-        # Passphrase section
-        pass_label = customtkinter.CTkLabel(
-            gen_dialog,
-            text="Passphrase (optional - leave empty for no encryption):",
-            font=customtkinter.CTkFont(size=12),
+    if result and result[0]:
+        _, private_key, public_key = result
+
+        # Display both keys in the info panel
+        set_info_chunks(
+            info_text,
+            (
+                "✓ Keys are existing\n\n",
+                "=== PUBLIC KEY ===\n",
+                public_key,
+                "\n\n",
+                "=== PRIVATE KEY (Keep this secret!) ===\n",
+                private_key,
+            ),
+            wrap="none",
         )
-        pass_label.pack(pady=(10, 5))
-
-        passphrase_entry = customtkinter.CTkEntry(
-            gen_dialog,
-            width=600,
-            height=40,
-            # show="*",
-            placeholder_text="Enter passphrase or leave empty",
+    else:
+        set_info(
+            info_text,
+            "❌ Key files not found. Please generate or import keys first.",
         )
-        passphrase_entry.pack(pady=5)
 
-        # Generate button callback
-        def on_generate():
-            import main
 
-            passphrase = passphrase_entry.get().strip()
+def _handle_generate(app, info_text, key_size: int):
+    """Generate a key_size-bit RSA key pair with an optional passphrase"""
+    choice = f"{key_size}-bit"
+    post_info(info_text, f"Generate RSA key pair ({choice})")
+
+    # Create a dialog for key generation with optional passphrase
+    gen_dialog = customtkinter.CTkToplevel(app)
+    gen_dialog.title(f"Generate {choice} RSA Key Pair")
+    gen_dialog.geometry("700x600")
+    gen_dialog.grab_set()
 
-            # Extract key size from choice
-            key_size = int(choice.replace("-bit", ""))
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        gen_dialog,
+        text=f"Generate {choice} RSA Key Pair\nEnter an optional passphrase to encrypt the private key",
+        font=_font(14, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
+
+    # Passphrase section
+    pass_label = customtkinter.CTkLabel(
+        gen_dialog,
+        text="Passphrase (optional - leave empty for no encryption):",
+        font=_font(12),
+    )
+    pass_label.pack(pady=(10, 5))
+
+    passphrase_entry = customtkinter.CTkEntry(
+        gen_dialog,
+        width=600,
+        height=40,
+        # show="*",
+        placeholder_text="Enter passphrase or leave empty",
+    )
+    passphrase_entry.pack(pady=5)
+
+    # Shown while the key pair is generated on the worker pool
+    progress = customtkinter.CTkProgressBar(gen_dialog, width=600, mode="indeterminate")
+
+    # Generate button callback
+    def on_generate():
+        passphrase = passphrase_entry.get().strip()
+
+        # Prime search takes seconds for large keys; keep the mainloop free
+        generate_btn.configure(state="disabled")
+        passphrase_entry.configure(state="disabled")
+        progress.pack(pady=10)
+        progress.start()
+
+        def on_generated(future):
+            if not gen_dialog.winfo_exists():
+                # Closing the dialog cancels: never overwrite the existing
+                # key pair with keys the user walked away from
+                set_info(
+                    info_text,
+                    "Key generation cancelled. Existing keys were left unchanged.",
+                )
+                return
+            progress.stop()
             gen_dialog.destroy()
-            # Generate RSA key pair
-            private_key, public_key, _ = main.generate_rsa_key_pair(
-                passphrase=passphrase if passphrase else None, key_size=key_size
+            private_key, public_key, _ = future.result()
+
+            if not (private_key and public_key):
+                messagebox.showerror("Error", "Key generation failed")
+                return
+
+            # Save to files in user-writable directory off the Tk thread
+            keys_dir = get_keys_directory()
+            run_in_background(
+                app,
+                lambda saved: on_saved(saved, keys_dir, private_key, public_key),
+                write_key_files,
+                (keys_dir / "private_key.pem", private_key),
+                (keys_dir / "public_key.pem", public_key),
             )
 
-            if private_key and public_key:
-                # Save to files in user-writable directory
-                try:
-                    keys_dir = get_keys_directory()
-                    private_key_path = keys_dir / "private_key.pem"
-                    public_key_path = keys_dir / "public_key.pem"
-
-                    with open(private_key_path, "w") as f:
-                        f.write(private_key)
-                    with open(public_key_path, "w") as f:
-                        f.write(public_key)
-
-                    # Prepare message for info panel
-                    message = f"✓ Successfully generated {choice} RSA key pair\n"
-                    message += f"✓ Keys saved to: {keys_dir}\n"
-                    passphrase_to_display = None
-
-                    if passphrase:
-                        message += "✓ Private key encrypted with passphrase\n\n"
-                        message += "=" * 50 + "\n"
-                        message += (
-                            f"Save this Passphrase - it will only be displayed once\n"
-                        )
-                        passphrase_to_display = passphrase
-                        message += (
-                            "\n"  # Placeholder for passphrase that will be inserted
-                        )
-                        message += "=" * 50 + "\n\n"
-                    else:
-                        message += (
-                            "⚠️ Private key NOT encrypted (no passphrase provided)\n\n"
-                        )
-
-                    message += "=== PUBLIC KEY ===\n"
-                    message += public_key + "\n\n"
-                    message += "=== PRIVATE KEY (Keep this secret!) ===\n"
-                    message += private_key
-
-                    # Display message using set_info
-                    set_info(info_text, message)
-
-                    # Now append passphrase in red if present
-                    if passphrase_to_display:
-                        info_text.configure(state="normal")
-                        # Find the position after "Save this Passphrase - it will only be displayed once\n"
-                        content = info_text.get("1.0", "end")
-                        insert_marker = (
-                            "Save this Passphrase - it will only be displayed once\n"
-                        )
-                        marker_pos = content.find(insert_marker)
-                        if marker_pos != -1:
-                            # Calculate line and column for insertion
-                            lines_before = content[
-                                : marker_pos + len(insert_marker)
-                            ].count("\n")
-                            insert_pos = f"{lines_before + 1}.0"
-                            info_text.insert(insert_pos, f"[{passphrase_to_display}]\n")
-                            end_pos = f"{lines_before + 2}.0"
-                            info_text.tag_add("passphrase_red", insert_pos, end_pos)
-                            info_text.tag_config("passphrase_red", foreground=RED)
-                        info_text.configure(state="disabled")
-
-                except Exception as e:
-                    messagebox.showerror(
-                        "Error", f"Failed to save keys to files: {str(e)}"
-                    )
+        def on_saved(future, keys_dir, private_key, public_key):
+            try:
+                future.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save keys to files: {str(e)}")
+                return
+            remember_rsa_keys(keys_dir, private_key, public_key)
+
+            # Prepare message fragments for info panel
+            parts = [
+                f"✓ Successfully generated {choice} RSA key pair\n",
+                f"✓ Keys saved to: {keys_dir}\n",
+            ]
+            passphrase_to_display = None
+
+            if passphrase:
+                parts.append("✓ Private key encrypted with passphrase\n\n")
+                parts.append(SEP50 + "\n")
+                parts.append("Save this Passphrase - it will only be displayed once\n")
+                passphrase_to_display = passphrase
+                # The passphrase goes on the line of this placeholder; count
+                # the short header lines now instead of searching the panel later
+                passphrase_line = sum(part.count("\n") for part in parts) + 1
+                parts.append("\n")
+                parts.append(SEP50 + "\n\n")
             else:
-                messagebox.showerror("Error", "Key generation failed")
+                parts.append("⚠️ Private key NOT encrypted (no passphrase provided)\n\n")
+
+            parts.append("=== PUBLIC KEY ===\n")
+            parts.append(public_key)
+            parts.append("\n\n")
+            parts.append("=== PRIVATE KEY (Keep this secret!) ===\n")
+            parts.append(private_key)
+
+            # Display message using set_info_chunks
+            set_info_chunks(info_text, parts, wrap="none")
+
+            # Now insert the passphrase in red if present
+            if passphrase_to_display:
+                insert_colored_line(
+                    info_text,
+                    passphrase_line,
+                    f"[{passphrase_to_display}]",
+                    RED,
+                    "passphrase_red",
+                )
 
-        generate_btn = customtkinter.CTkButton(
-            gen_dialog,
-            text="Generate Keys",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=on_generate,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE
-        )
-        generate_btn.pack(pady=20)
-        # generate_btn.destroy()
-        return
-    if choice == "Public Key":
-        clear_info(info_text)
-        public_key = retrieve_rsa_keys("public")
-        set_info(info_text, public_key)
-        return
-    if choice == "Private Key":
-        clear_info(info_text)
-        messagebox.showwarning(
-            "Security Warning", "Be cautious when handling private keys!"
-        )
-        private_key = retrieve_rsa_keys("private")
-        set_info(info_text, private_key)
-        return
-    if choice == "Encrypt Data":
-        import main
-
-        message = ""
-        clear_info(info_text)
-        set_info(info_text, "Enter data to encrypt in the dialog.")
-
-        # Create a dialog window for data encryption
-        encrypt_dialog = customtkinter.CTkToplevel(app)
-        encrypt_dialog.title("Encrypt Data")
-        encrypt_dialog.geometry("700x500")
-        encrypt_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            encrypt_dialog,
-            text="Enter the data you want to encrypt below:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
+        # Generate RSA key pair
+        run_in_background(
+            app,
+            on_generated,
+            _main.generate_rsa_key_pair,
+            passphrase=passphrase if passphrase else None,
+            key_size=key_size,
         )
-        instructions.pack(pady=(20, 10))
 
-        # Data input section
-        data_label = customtkinter.CTkLabel(
-            encrypt_dialog,
-            text="Data to Encrypt:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        data_label.pack(pady=(10, 5), anchor="w", padx=20)
+    generate_btn = customtkinter.CTkButton(
+        gen_dialog,
+        text="Generate Keys",
+        font=_font(14, "bold"),
+        command=on_generate,
+        **_DIALOG_BTN,
+    )
+    generate_btn.pack(pady=20)
+    # generate_btn.destroy()
 
-        data_text = customtkinter.CTkTextbox(
-            encrypt_dialog, height=200, width=650, font=customtkinter.CTkFont(size=11)
-        )
-        data_text.pack(pady=5, padx=20)
 
-        # Encrypt button
-        def perform_encryption(message=message):
-            data_to_encrypt = data_text.get("1.0", "end").strip()
+def _handle_public_key(app, info_text):
+    """Show the stored public key"""
+    public_key = retrieve_rsa_keys("public")
+    set_info(info_text, public_key)
 
-            if not data_to_encrypt:
-                messagebox.showerror("Error", "Please enter data to encrypt!")
-                return
 
-            try:
-                # Call the encryption function
-                encrypted_dict, key = main.encrypt_data_not_binary(data_to_encrypt)
-
-                if encrypted_dict and key:
-                    # Extract the encrypted data from the dictionary
-                    # The key is the encryption key (as string), value is encrypted data
-                    key_str = key.decode() if isinstance(key, bytes) else key
-                    encrypted_data = encrypted_dict.get(key_str, "")
-
-                    # Prepare message for info panel
-                    message += f"✓ Data encrypted successfully\n\n"
-                    message += f"===== ORIGINAL DATA =====\n"
-                    message += f"{data_to_encrypt}\n\n"
-                    message += "==END OF ORIGINAL DATA==\n"
-                    message += "========================\n\n"
-                    message += "=== ENCRYPTED DATA ===\n"
-                    message += f"{encrypted_data}\n\n"
-                    message += "=== ENCRYPTION KEY ===\n"
-                    message += f"{key_str}\n\n"
-                    message += "⚠️ Save both the encrypted data and key securely!"
-
-                    # Display result using set_info
-                    set_info(info_text, message)
+def _handle_private_key(app, info_text):
+    """Show the stored private key after a warning"""
+    clear_info(info_text)
+    messagebox.showwarning(
+        "Security Warning", "Be cautious when handling private keys!"
+    )
+    private_key = retrieve_rsa_keys("private")
+    set_info(info_text, private_key)
 
-                    messagebox.showinfo(
-                        "Success",
-                        "Data encrypted successfully!\nCheck the information panel for encrypted data and key.",
-                    )
-                    encrypt_dialog.destroy()
-                else:
-                    messagebox.showerror(
-                        "Error", "Encryption failed. Please try again."
-                    )
-            except Exception as e:
-                import traceback
 
-                error_details = traceback.format_exc()
-                print(f"Encryption error details:\n{error_details}")
-                messagebox.showerror(
-                    "Error",
-                    f"Encryption failed: {str(e)}\n\nCheck console for details.",
+def _handle_encrypt_data(app, info_text):
+    """Encrypt text entered in a dialog"""
+    post_info(info_text, "Enter data to encrypt in the dialog.")
+
+    # Create a dialog window for data encryption
+    encrypt_dialog = customtkinter.CTkToplevel(app)
+    encrypt_dialog.title("Encrypt Data")
+    encrypt_dialog.geometry("700x500")
+    encrypt_dialog.grab_set()
+
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        encrypt_dialog,
+        text="Enter the data you want to encrypt below:",
+        font=_font(14, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
+
+    # Data input section
+    data_label = customtkinter.CTkLabel(
+        encrypt_dialog,
+        text="Data to Encrypt:",
+        font=_font(14, "bold"),
+    )
+    data_label.pack(pady=(10, 5), anchor="w", padx=20)
+
+    data_text = customtkinter.CTkTextbox(
+        encrypt_dialog, height=200, width=650, font=_font(11)
+    )
+    data_text.pack(pady=5, padx=20)
+
+    # Encrypt button
+    def perform_encryption():
+        data_to_encrypt = data_text.get("1.0", "end").strip()
+
+        if not data_to_encrypt:
+            messagebox.showerror("Error", "Please enter data to encrypt!")
+            return
+
+        try:
+            # Call the encryption function
+            encrypted_dict, key = _main.encrypt_data_not_binary(data_to_encrypt)
+
+            if encrypted_dict and key:
+                # A single string input yields exactly one {key: token} entry;
+                # take the token directly rather than looking it up by key
+                encrypted_data = next(iter(encrypted_dict.values()))
+                key_str = key.decode() if isinstance(key, bytes) else key
+
+                # Prepare message fragments for info panel
+                parts = [
+                    "✓ Data encrypted successfully\n\n",
+                    "===== ORIGINAL DATA =====\n",
+                    data_to_encrypt,
+                    "\n\n==END OF ORIGINAL DATA==\n",
+                    "========================\n\n",
+                    "=== ENCRYPTED DATA ===\n",
+                    encrypted_data,
+                    "\n\n=== ENCRYPTION KEY ===\n",
+                    key_str,
+                    "\n\n⚠️ Save both the encrypted data and key securely!",
+                ]
+
+                # Display result using set_info
+                set_info(info_text, "".join(parts))
+
+                messagebox.showinfo(
+                    "Success",
+                    "Data encrypted successfully!\nCheck the information panel for encrypted data and key.",
                 )
+                encrypt_dialog.destroy()
+            else:
+                messagebox.showerror("Error", "Encryption failed. Please try again.")
+        except Exception as e:
+            error_details = traceback.format_exc()
+            print(f"Encryption error details:\n{error_details}")
+            messagebox.showerror(
+                "Error",
+                f"Encryption failed: {str(e)}\n\nCheck console for details.",
+            )
 
-        encrypt_btn = customtkinter.CTkButton(
-            encrypt_dialog,
-            text="Encrypt",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=perform_encryption,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE
-        )
-        encrypt_btn.pack(pady=20)
+    encrypt_btn = customtkinter.CTkButton(
+        encrypt_dialog,
+        text="Encrypt",
+        font=_font(14, "bold"),
+        command=perform_encryption,
+        **_DIALOG_BTN,
+    )
+    encrypt_btn.pack(pady=20)
 
-        return
-    if choice == "Encrypt File":
-        clear_info(info_text)
-        set_info(info_text, "Select files to encrypt...")
-
-        # Create a dialog window for file encryption
-        file_encrypt_dialog = customtkinter.CTkToplevel(app)
-        file_encrypt_dialog.title("Encrypt Files")
-        file_encrypt_dialog.geometry("700x600")
-        file_encrypt_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            file_encrypt_dialog,
-            text="Select files to encrypt\nEncrypted files will be saved as: file<encrypted>.ext",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        instructions.pack(pady=(20, 10))
 
-        # Selected files display
-        files_label = customtkinter.CTkLabel(
-            file_encrypt_dialog,
-            text="Selected Files:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        files_label.pack(pady=(10, 5), anchor="w", padx=20)
+def _handle_encrypt_file(app, info_text):
+    """Encrypt selected files with Fernet"""
+    post_info(info_text, "Select files to encrypt...")
 
-        files_listbox = customtkinter.CTkTextbox(
-            file_encrypt_dialog,
-            height=200,
-            width=650,
-            font=customtkinter.CTkFont(size=11),
-        )
-        files_listbox.pack(pady=5, padx=20)
-        files_listbox.configure(state="disabled")
-
-        # Store selected files
-        selected_files = []
-
-        # Choose files button
-        def choose_files_to_encrypt():
-            nonlocal selected_files
-            selected_files = choose_files(multiple=True)
-
-            if selected_files:
-                files_listbox.configure(state="normal")
-                files_listbox.delete("1.0", "end")
-                files_listbox.insert("1.0", "\n".join(selected_files))
-                files_listbox.configure(state="disabled")
-
-        choose_btn = customtkinter.CTkButton(
-            file_encrypt_dialog,
-            text="Choose Files",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=choose_files_to_encrypt,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        choose_btn.pack(pady=10)
+    # Create a dialog window for file encryption
+    file_encrypt_dialog = customtkinter.CTkToplevel(app)
+    file_encrypt_dialog.title("Encrypt Files")
+    file_encrypt_dialog.geometry("700x600")
+    file_encrypt_dialog.grab_set()
 
-        # Encrypt button
-        def perform_file_encryption():
-            import main
-            from cryptography.fernet import Fernet
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        file_encrypt_dialog,
+        text="Select files to encrypt\nEncrypted files will be saved as: file<encrypted>.ext",
+        font=_font(14, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
 
-            if not selected_files:
-                messagebox.showerror("Error", "Please select files to encrypt!")
-                return
+    # Selected files display
+    files_label = customtkinter.CTkLabel(
+        file_encrypt_dialog,
+        text="Selected Files:",
+        font=_font(14, "bold"),
+    )
+    files_label.pack(pady=(10, 5), anchor="w", padx=20)
+
+    files_listbox = customtkinter.CTkTextbox(
+        file_encrypt_dialog,
+        height=200,
+        width=650,
+        font=_font(11),
+    )
+    files_listbox.pack(pady=5, padx=20)
+    files_listbox.configure(state="disabled")
 
+    # Store selected files; refilled in place so the callbacks share one list
+    selected_files = []
+
+    # Choose files button
+    def choose_files_to_encrypt():
+        selected_files[:] = choose_files(multiple=True)
+
+        if selected_files:
+            set_lines(files_listbox, "", selected_files)
+
+    choose_btn = customtkinter.CTkButton(
+        file_encrypt_dialog,
+        text="Choose Files",
+        font=_font(14, "bold"),
+        command=choose_files_to_encrypt,
+        **_DIALOG_BTN,
+    )
+    choose_btn.pack(pady=10)
+
+    # Encrypt button
+    def perform_file_encryption():
+        if not selected_files:
+            messagebox.showerror("Error", "Please select files to encrypt!")
+            return
+
+        # Split every selected path once, up front
+        files = list(selected_files)
+        dirs = [os.path.dirname(p) for p in files]
+        stems_exts = [os.path.splitext(os.path.basename(p)) for p in files]
+
+        def _encrypt_one(file_path, file_dir, stem_ext):
             try:
-                new_files = []
-                file_keys = []
-                encrypted_data_list = []
-
-                # Encrypt each file
-                for file_path in selected_files:
-                    encrypted_data, file_key, original_name = (
-                        main.encrypt_file_with_fernet(file_path)
-                    )
+                encrypted_data, file_key, _ = _main.encrypt_file_with_fernet(file_path)
+                if not (encrypted_data and file_key):
+                    return None
 
-                    if encrypted_data and file_key:
-                        # Create encrypted filename: file<encrypted>.ext
-                        file_parts = os.path.splitext(original_name)
-                        encrypted_filename = (
-                            f"{file_parts[0]}<encrypted>{file_parts[1]}"
-                        )
-                        encrypted_file_path = os.path.join(
-                            os.path.dirname(file_path), encrypted_filename
-                        )
-
-                        # Save encrypted data to file
-                        with open(encrypted_file_path, "w") as f:
-                            f.write(encrypted_data)
-
-                        new_files.append(encrypted_file_path)
-                        file_keys.append(file_key)
-                        encrypted_data_list.append(
-                            (original_name, encrypted_filename, file_key)
-                        )
-
-                if new_files:
-                    # Prepare message for info panel
-                    message = f"✓ Successfully encrypted {len(new_files)} file(s)\n\n"
-                    message += "=== ORIGINAL FILES ===\n"
-                    for orig_file in selected_files:
-                        message += f"{orig_file}\n"
-                    message += "\n=== ENCRYPTED FILES ===\n"
-                    for new_file in new_files:
-                        message += f"{new_file}\n"
-
-                    #       # Display encryption keys - one per file with clear separation
-                    #       message += "\n" + "="*50 + "\n"
-                    #       message += "=== ENCRYPTION KEYS ===\n"
-                    #       message += "="*50 + "\n"
-                    mykeys = []
-                    # for _, (_, _,key) in enumerate(encrypted_data_list, 1):
-                    # message += f"\n--- FILE {i} ---\n"
-                    # message += f"Original: {orig_name}\n"
-                    # message += f"Encrypted: {enc_name}\n"
-                    #      message += f"KEY: \n {key}\n"
-                    for key in encrypted_data_list:
-                        mykeys.append(f"{key[2]}")
-                    #      if i < len(encrypted_data_list):
-                    #          message += "-" * 40 + "\n"
-                    message += "\n" + "=" * 50 + "\n"
-                    message += f"KEYS IN STRICT ORDER\n\n"
-                    for i, row in enumerate(mykeys, 1):
-                        message += f"{row}\n"  # Show first 20 chars
-
-                    message += "\n" + "=" * 50 + "\n"
-                    message += "⚠️ IMPORTANT: Save these encryption keys securely!\n"
-                    message += "You will need them to decrypt the files later.\n"
-                    message += "=" * 50
-
-                    # Display result using set_info
-                    set_info(info_text, message)
+                # Create encrypted filename: file<encrypted>.ext
+                encrypted_filename = f"{stem_ext[0]}<encrypted>{stem_ext[1]}"
+                encrypted_file_path = os.path.join(file_dir, encrypted_filename)
 
-                    messagebox.showinfo(
-                        "Success",
-                        f"Successfully encrypted {len(new_files)} file(s)!\nCheck the information panel for details.",
-                    )
-                    file_encrypt_dialog.destroy()
-                else:
-                    messagebox.showerror(
-                        "Error", "File encryption failed. Please try again."
-                    )
+                # Save encrypted data to file; Fernet tokens are ASCII, so
+                # skip the text layer and its newline translation
+                Path(encrypted_file_path).write_bytes(encrypted_data.encode("ascii"))
+            except Exception as e:
+                # One unreadable or unwritable file must not abort the others
+                print(f"Error encrypting {file_path}: {e}")
+                return None
+            return file_key, encrypted_file_path
+
+        def encrypt_all(files, dirs, stems_exts):
+            # Encrypt files concurrently; map() yields results in input order,
+            # which keeps the keys listed below in the same order as the files
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                return list(pool.map(_encrypt_one, files, dirs, stems_exts))
+
+        def on_encrypted(future):
+            if file_encrypt_dialog.winfo_exists():
+                encrypt_files_btn.configure(state="normal")
+            try:
+                show_report(future.result())
             except Exception as e:
-                import traceback
-
                 error_details = traceback.format_exc()
                 print(f"File encryption error details:\n{error_details}")
                 messagebox.showerror(
@@ -810,104 +1294,153 @@ def menu_action(app, info_text, choice: str):
                     f"File encryption failed: {str(e)}\n\nCheck console for details.",
                 )
 
-        encrypt_files_btn = customtkinter.CTkButton(
-            file_encrypt_dialog,
-            text="Encrypt Files",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=perform_file_encryption,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        encrypt_files_btn.pack(pady=20)
+        def show_report(results):
+            original_files = []
+            new_files = []
+            file_keys = []
+            failed_files = []
+
+            for file_path, result in zip(files, results):
+                if result is None:
+                    failed_files.append(file_path)
+                    continue
+                file_key, encrypted_file_path = result
+                original_files.append(file_path)
+                new_files.append(encrypted_file_path)
+                file_keys.append(file_key)
+
+            # Prepare message fragments for info panel
+            parts = []
+            if new_files:
+                parts.append(f"✓ Successfully encrypted {len(new_files)} file(s)\n")
+            if failed_files:
+                parts.append(f"❌ Failed to encrypt {len(failed_files)} file(s)\n")
+            parts.append("\n")
+
+            if new_files:
+                parts.append("=== ORIGINAL FILES ===\n")
+                parts.extend(f"{orig_file}\n" for orig_file in original_files)
+                parts.append("\n=== ENCRYPTED FILES ===\n")
+                parts.extend(f"{new_file}\n" for new_file in new_files)
+
+                # Keys are listed one per line, in the same order as the files
+                parts.append("\n" + SEP50 + "\n")
+                parts.append("KEYS IN STRICT ORDER\n\n")
+                parts.extend(f"{file_key}\n" for file_key in file_keys)
+
+            if failed_files:
+                parts.append("\n=== FAILED FILES ===\n")
+                parts.extend(f"{failed_file}\n" for failed_file in failed_files)
+
+            parts.append("\n" + SEP50 + "\n")
+            if new_files:
+                parts.append("⚠️ IMPORTANT: Save these encryption keys securely!\n")
+                parts.append("You will need them to decrypt the files later.\n")
+            if failed_files:
+                parts.append("❌ Failed files have no key and were not encrypted\n")
+            parts.append(SEP50)
+            message = "".join(parts)
+
+            # Display result using set_info
+            set_info(info_text, message)
+
+            # Show appropriate message
+            if new_files and not failed_files:
+                messagebox.showinfo(
+                    "Success",
+                    f"Successfully encrypted {len(new_files)} file(s)!\nCheck the information panel for details.",
+                )
+            elif new_files and failed_files:
+                messagebox.showwarning(
+                    "Partial Success",
+                    f"Encrypted {len(new_files)} file(s), but {len(failed_files)} failed!\nCheck the information panel for details.",
+                )
+            else:
+                messagebox.showerror(
+                    "Error",
+                    f"All {len(failed_files)} file(s) failed to encrypt!\nCheck the information panel for details.",
+                )
+                return
+
+            if file_encrypt_dialog.winfo_exists():
+                file_encrypt_dialog.destroy()
 
+        # Encrypt on the worker pool so the dialog keeps repainting
+        encrypt_files_btn.configure(state="disabled")
+        run_in_background(app, on_encrypted, encrypt_all, files, dirs, stems_exts)
+
+    encrypt_files_btn = customtkinter.CTkButton(
+        file_encrypt_dialog,
+        text="Encrypt Files",
+        font=_font(14, "bold"),
+        command=perform_file_encryption,
+        **_DIALOG_BTN,
+    )
+    encrypt_files_btn.pack(pady=20)
+
+
+def _handle_decrypt_data(app, info_text):
+    """Decrypt text entered in a dialog"""
+    post_info(info_text, "Enter encrypted data and key to decrypt...")
+
+    decrypt_dialog, created = show_cached_dialog(
+        app, "_decrypt_data_dialog", "Decrypt Data", "700x600"
+    )
+    if not created:
         return
-    if choice == "Decrypt Data":
-        clear_info(info_text)
-        set_info(info_text, "Enter encrypted data and key to decrypt...")
-
-        # Create a dialog window for data decryption
-        decrypt_dialog = customtkinter.CTkToplevel(app)
-        decrypt_dialog.title("Decrypt Data")
-        decrypt_dialog.geometry("700x600")
-        decrypt_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            decrypt_dialog,
-            text="Enter the encrypted data and encryption key below:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        instructions.pack(pady=(20, 10))
 
-        # Encrypted data section
-        encrypted_label = customtkinter.CTkLabel(
-            decrypt_dialog,
-            text="Encrypted Data:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        encrypted_label.pack(pady=(10, 5), anchor="w", padx=20)
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        decrypt_dialog,
+        text="Enter the encrypted data and encryption key below:",
+        font=_font(14, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
 
-        encrypted_text = customtkinter.CTkTextbox(
-            decrypt_dialog, height=200, width=650, font=customtkinter.CTkFont(size=11)
-        )
-        encrypted_text.pack(pady=5, padx=20)
+    # Encrypted data section
+    encrypted_label = customtkinter.CTkLabel(
+        decrypt_dialog,
+        text="Encrypted Data:",
+        font=_font(14, "bold"),
+    )
+    encrypted_label.pack(pady=(10, 5), anchor="w", padx=20)
 
-        # Key section
-        key_label = customtkinter.CTkLabel(
-            decrypt_dialog,
-            text="Encryption Key:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        key_label.pack(pady=(10, 5), anchor="w", padx=20)
+    encrypted_text = customtkinter.CTkTextbox(
+        decrypt_dialog, height=200, width=650, font=_font(11)
+    )
+    encrypted_text.pack(pady=5, padx=20)
 
-        key_entry = customtkinter.CTkEntry(
-            decrypt_dialog, width=650, height=40, font=customtkinter.CTkFont(size=11)
-        )
-        key_entry.pack(pady=5, padx=20)
+    # Key section
+    key_label = customtkinter.CTkLabel(
+        decrypt_dialog,
+        text="Encryption Key:",
+        font=_font(14, "bold"),
+    )
+    key_label.pack(pady=(10, 5), anchor="w", padx=20)
 
-        # Decrypt button
-        def perform_data_decryption():
-            import main
+    key_entry = customtkinter.CTkEntry(
+        decrypt_dialog, width=650, height=40, font=_font(11)
+    )
+    key_entry.pack(pady=5, padx=20)
 
-            encrypted_data = encrypted_text.get("1.0", "end").strip()
-            key = key_entry.get().strip()
+    # Decrypt button
+    def perform_data_decryption():
+        encrypted_data = encrypted_text.get("1.0", "end").strip()
+        key = key_entry.get().strip()
 
-            if not encrypted_data or not key:
-                messagebox.showerror(
-                    "Error", "Please enter both encrypted data and key!"
-                )
-                return
+        if not encrypted_data or not key:
+            messagebox.showerror("Error", "Please enter both encrypted data and key!")
+            return
 
-            try:
-                # Call the decryption function
-                decrypted_result = main.decrypt_data_not_binary(encrypted_data, key)
-
-                if decrypted_result:
-                    # Prepare message for info panel
-                    message = "✓ Data decrypted successfully\n\n"
-                    message += "=== ENCRYPTED DATA ===\n"
-                    message += f"{encrypted_data}\n\n"
-                    message += "=== DECRYPTED DATA ===\n"
-                    message += f"{decrypted_result}\n\n"
-                    message += "=== KEY USED ===\n"
-                    message += f"{key}"
-
-                    # Display result using set_info
-                    set_info(info_text, message)
+        decrypt_btn.configure(state="disabled")
+        session = decrypt_dialog.session
 
-                    messagebox.showinfo(
-                        "Success",
-                        "Data decrypted successfully!\nCheck the information panel for decrypted data.",
-                    )
-                    decrypt_dialog.destroy()
-                else:
-                    messagebox.showerror(
-                        "Error",
-                        "Decryption failed. Please check your encrypted data and key.",
-                    )
+        def on_decrypted(future):
+            if decrypt_dialog.winfo_exists():
+                decrypt_btn.configure(state="normal")
+            try:
+                show_decrypted(future.result())
             except Exception as e:
-                import traceback
-
                 error_details = traceback.format_exc()
                 print(f"Decryption error details:\n{error_details}")
                 messagebox.showerror(
@@ -915,378 +1448,392 @@ def menu_action(app, info_text, choice: str):
                     f"Decryption failed: {str(e)}\n\nCheck console for details.",
                 )
 
-        decrypt_btn = customtkinter.CTkButton(
-            decrypt_dialog,
-            text="Decrypt",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=perform_data_decryption,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
+        def show_decrypted(decrypted_result):
+            if decrypted_result:
+                # Prepare message for info panel
+                parts = [
+                    "✓ Data decrypted successfully\n\n",
+                    "=== ENCRYPTED DATA ===\n",
+                    encrypted_data,
+                    "\n\n=== DECRYPTED DATA ===\n",
+                    str(decrypted_result),
+                    "\n\n=== KEY USED ===\n",
+                    key,
+                ]
+
+                # Display result using set_info
+                set_info(info_text, "".join(parts))
+
+                messagebox.showinfo(
+                    "Success",
+                    "Data decrypted successfully!\nCheck the information panel for decrypted data.",
+                )
+                if session_open(decrypt_dialog, session):
+                    hide_dialog(decrypt_dialog)
+            else:
+                messagebox.showerror(
+                    "Error",
+                    "Decryption failed. Please check your encrypted data and key.",
+                )
+
+        # Decrypt on the worker pool so the dialog keeps repainting
+        run_in_background(
+            app, on_decrypted, _main.decrypt_data_not_binary, encrypted_data, key
         )
-        decrypt_btn.pack(pady=20)
 
+    decrypt_btn = customtkinter.CTkButton(
+        decrypt_dialog,
+        text="Decrypt",
+        font=_font(14, "bold"),
+        command=perform_data_decryption,
+        **_DIALOG_BTN,
+    )
+    decrypt_btn.pack(pady=20)
+
+    def clear_fields():
+        # Don't keep ciphertext or the key in a hidden window
+        encrypted_text.delete("1.0", "end")
+        key_entry.delete(0, "end")
+
+    decrypt_dialog.on_hide = clear_fields
+
+
+def _handle_decrypt_file(app, info_text):
+    """Decrypt selected encrypted files"""
+    post_info(info_text, "Select encrypted files to decrypt...")
+
+    file_decrypt_dialog, created = show_cached_dialog(
+        app, "_decrypt_file_dialog", "Decrypt Files", "700x600"
+    )
+    if not created:
         return
-    if choice == "Decrypt File":
-        clear_info(info_text)
-        set_info(info_text, "Select encrypted files to decrypt...")
-
-        # Create a dialog window for file decryption
-        file_decrypt_dialog = customtkinter.CTkToplevel(app)
-        file_decrypt_dialog.title("Decrypt Files")
-        file_decrypt_dialog.geometry("700x600")
-        file_decrypt_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            file_decrypt_dialog,
-            text="Select encrypted files (file<encrypted>.ext format)\nEnter encryption keys (one per line, matching file order):",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        instructions.pack(pady=(20, 10))
 
-        # Selected files display
-        files_label = customtkinter.CTkLabel(
-            file_decrypt_dialog,
-            text="Selected Encrypted Files:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        files_label.pack(pady=(10, 5), anchor="w", padx=20)
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        file_decrypt_dialog,
+        text="Select encrypted files (file<encrypted>.ext format)\nEnter encryption keys (one per line, matching file order):",
+        font=_font(14, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
 
-        files_listbox = customtkinter.CTkTextbox(
-            file_decrypt_dialog,
-            height=150,
-            width=650,
-            font=customtkinter.CTkFont(size=11),
-        )
-        files_listbox.pack(pady=5, padx=20)
-        files_listbox.configure(state="disabled")
-
-        # Store selected files
-        selected_files = []
-
-        # Choose files button
-        def choose_files_to_decrypt():
-            nonlocal selected_files
-            selected_files = choose_files(multiple=True)
-
-            if selected_files:
-                files_listbox.configure(state="normal")
-                files_listbox.delete("1.0", "end")
-                files_listbox.insert("1.0", "\n".join(selected_files))
-                files_listbox.configure(state="disabled")
-
-        choose_btn = customtkinter.CTkButton(
-            file_decrypt_dialog,
-            text="Choose Encrypted Files",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=choose_files_to_decrypt,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        choose_btn.pack(pady=10)
+    # Selected files display
+    files_label = customtkinter.CTkLabel(
+        file_decrypt_dialog,
+        text="Selected Encrypted Files:",
+        font=_font(14, "bold"),
+    )
+    files_label.pack(pady=(10, 5), anchor="w", padx=20)
 
-        # Key section - Changed to textbox for multiple keys
-        key_label = customtkinter.CTkLabel(
-            file_decrypt_dialog,
-            text="Encryption Keys (one per line, in same order as files):",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        key_label.pack(pady=(10, 5), anchor="w", padx=20)
+    files_listbox = customtkinter.CTkTextbox(
+        file_decrypt_dialog,
+        height=150,
+        width=650,
+        font=_font(11),
+    )
+    files_listbox.pack(pady=5, padx=20)
+    files_listbox.configure(state="disabled")
 
-        key_textbox = customtkinter.CTkTextbox(
-            file_decrypt_dialog,
-            width=650,
-            height=120,
-            font=customtkinter.CTkFont(size=11),
-        )
-        key_textbox.pack(pady=5, padx=20)
+    # Store selected files; refilled in place so the callbacks share one list
+    selected_files = []
 
-        # Decrypt button
-        def perform_file_decryption():
-            import main
+    # Choose files button
+    def choose_files_to_decrypt():
+        selected_files[:] = choose_files(multiple=True)
 
-            if not selected_files:
-                messagebox.showerror("Error", "Please select files to decrypt!")
-                return
+        if selected_files:
+            set_lines(files_listbox, "", selected_files)
 
-            # Get all keys from textbox (one per line)
-            keys_text = key_textbox.get("1.0", "end").strip()
-            if not keys_text:
-                messagebox.showerror("Error", "Please enter the encryption key(s)!")
-                return
+    choose_btn = customtkinter.CTkButton(
+        file_decrypt_dialog,
+        text="Choose Encrypted Files",
+        font=_font(14, "bold"),
+        command=choose_files_to_decrypt,
+        **_DIALOG_BTN,
+    )
+    choose_btn.pack(pady=10)
 
-            # Split keys by line, remove blank lines, and strip whitespace
-            keys = [line.strip() for line in keys_text.splitlines() if line.strip()]
+    # Key section - Changed to textbox for multiple keys
+    key_label = customtkinter.CTkLabel(
+        file_decrypt_dialog,
+        text="Encryption Keys (one per line, in same order as files):",
+        font=_font(14, "bold"),
+    )
+    key_label.pack(pady=(10, 5), anchor="w", padx=20)
+
+    key_textbox = customtkinter.CTkTextbox(
+        file_decrypt_dialog,
+        width=650,
+        height=120,
+        font=_font(11),
+    )
+    key_textbox.pack(pady=5, padx=20)
+
+    # Decrypt button
+    def perform_file_decryption():
+        if not selected_files:
+            messagebox.showerror("Error", "Please select files to decrypt!")
+            return
+
+        # Get all keys from textbox (one per line)
+        keys_text = key_textbox.get("1.0", "end").strip()
+        if not keys_text:
+            messagebox.showerror("Error", "Please enter the encryption key(s)!")
+            return
+
+        # Split keys by line, remove blank lines, and strip whitespace
+        keys = [line.strip() for line in keys_text.splitlines() if line.strip()]
+
+        # Debug: print keys to console
+        print(f"Number of files: {len(selected_files)}")
+        print(f"Number of keys parsed: {len(keys)}")
+        for i, key in enumerate(keys, 1):
+            print(f"Key {i} (length {len(key)}): {key[:20]}...")  # Show first 20 chars
+
+        # Check if number of keys matches number of files
+        if len(keys) != len(selected_files):
+            messagebox.showerror(
+                "Error",
+                f"Number of keys ({len(keys)}) doesn't match number of files ({len(selected_files)})!\n\n"
+                f"Please provide one key per line, matching the order of selected files.\n\n"
+                f"Keys found: {len(keys)}\nFiles selected: {len(selected_files)}",
+            )
+            return
 
-            # Debug: print keys to console
-            print(f"Number of files: {len(selected_files)}")
-            print(f"Number of keys parsed: {len(keys)}")
-            for i, key in enumerate(keys, 1):
-                print(
-                    f"Key {i} (length {len(key)}): {key[:20]}..."
-                )  # Show first 20 chars
+        def _decrypt_one(file_path, key):
+            # Remove <encrypted> from filename to get original name
+            encrypted_name = os.path.basename(file_path)
+            original_filename = encrypted_name.replace("<encrypted>", "")
+            output_path = os.path.join(os.path.dirname(file_path), original_filename)
+            try:
+                # Read the encrypted token as bytes; it goes to Fernet as-is
+                with open(file_path, "rb") as f:
+                    encrypted_data = f.read().strip()
 
-            # Check if number of keys matches number of files
-            if len(keys) != len(selected_files):
+                # Decrypt the file
+                success = _main.decrypt_file_with_fernet(
+                    encrypted_data, key, output_path
+                )
+                print(f"Decryption result for {encrypted_name}: {success}")
+            except Exception as e:
+                # One bad file or key must not abort the others
+                print(f"Error decrypting {file_path}: {e}")
+                success = False
+            return encrypted_name, original_filename, key, bool(success), output_path
+
+        def decrypt_all(files, keys):
+            # Decrypt files concurrently; map() yields results in input order,
+            # so the report lists files in the order they were selected
+            workers = min(os.cpu_count() or 1, len(files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_decrypt_one, files, keys))
+
+        def on_decrypted(future):
+            if file_decrypt_dialog.winfo_exists():
+                decrypt_files_btn.configure(state="normal")
+            try:
+                show_report(future.result())
+            except Exception as e:
+                error_details = traceback.format_exc()
+                print(f"File decryption error details:\n{error_details}")
                 messagebox.showerror(
                     "Error",
-                    f"Number of keys ({len(keys)}) doesn't match number of files ({len(selected_files)})!\n\n"
-                    f"Please provide one key per line, matching the order of selected files.\n\n"
-                    f"Keys found: {len(keys)}\nFiles selected: {len(selected_files)}",
+                    f"File decryption failed: {str(e)}\n\nCheck console for details.",
                 )
-                return
 
-            try:
-                decrypted_files = []
-                decryption_info = []
-                failed_files = []
-
-                # Decrypt each file with its corresponding key
-                for file_path, key in zip(selected_files, keys):
-                    try:
-                        # Read encrypted data from file
-                        with open(file_path, "r") as f:
-                            encrypted_data = f.read().strip()
-
-                        # Remove <encrypted> from filename to get original name
-                        original_filename = os.path.basename(file_path).replace(
-                            "<encrypted>", ""
-                        )
-                        output_path = os.path.join(
-                            os.path.dirname(file_path), original_filename
-                        )
-
-                        # Decrypt the file
-                        success = main.decrypt_file_with_fernet(
-                            encrypted_data, key, output_path
-                        )
-
-                        print(
-                            f"Decryption result for {os.path.basename(file_path)}: {success} (type: {type(success)})"
-                        )
-
-                        if success:
-                            decrypted_files.append(output_path)
-                            decryption_info.append(
-                                (
-                                    os.path.basename(file_path),
-                                    original_filename,
-                                    key,
-                                    True,
-                                )
-                            )
-                        else:
-                            failed_files.append(os.path.basename(file_path))
-                            decryption_info.append(
-                                (
-                                    os.path.basename(file_path),
-                                    original_filename,
-                                    key,
-                                    False,
-                                )
-                            )
-                    except Exception as e:
-                        failed_files.append(os.path.basename(file_path))
-                        decryption_info.append(
-                            (os.path.basename(file_path), original_filename, key, False)
-                        )
-                        print(f"Error decrypting {file_path}: {e}")
-
-                if decrypted_files or failed_files:
-                    # Prepare message for info panel
-                    message = ""
-                    if decrypted_files:
-                        message += (
-                            f"✓ Successfully decrypted {len(decrypted_files)} file(s)\n"
-                        )
-                    if failed_files:
-                        message += f"❌ Failed to decrypt {len(failed_files)} file(s)\n"
-                    message += "\n"
-
-                    # Show detailed info for each file
-                    message += "=" * 50 + "\n"
-                    message += "=== DECRYPTION DETAILS ===\n"
-                    message += "=" * 50 + "\n"
-
-                    for i, (enc_name, dec_name, key, success) in enumerate(
-                        decryption_info, 1
-                    ):
-                        message += f"\n--- FILE {i} ---\n"
-                        message += f"Encrypted: {enc_name}\n"
-                        message += f"Decrypted: {dec_name}\n"
-                        message += f"Key Used: {key}\n"
-                        message += (
-                            f"Status: {'✓ Success' if success else '❌ Failed'}\n"
-                        )
-                        if i < len(decryption_info):
-                            message += "-" * 40 + "\n"
-
-                    message += "\n" + "=" * 50 + "\n"
-                    if decrypted_files:
-                        message += "✓ Successful files have been restored to their original names\n"
-                    if failed_files:
-                        message += "❌ Failed files may have incorrect keys\n"
-                    message += "=" * 50
-
-                    # Display result using set_info
-                    set_info(info_text, message)
-
-                    # Show appropriate message
-                    if decrypted_files and not failed_files:
-                        messagebox.showinfo(
-                            "Success",
-                            f"Successfully decrypted {len(decrypted_files)} file(s)!\nCheck the information panel for details.",
-                        )
-                    elif decrypted_files and failed_files:
-                        messagebox.showwarning(
-                            "Partial Success",
-                            f"Decrypted {len(decrypted_files)} file(s), but {len(failed_files)} failed!\nCheck the information panel for details.",
-                        )
-                    else:
-                        messagebox.showerror(
-                            "Error",
-                            f"All {len(failed_files)} file(s) failed to decrypt!\nPlease check your keys.",
-                        )
-
-                    file_decrypt_dialog.destroy()
+        def show_report(results):
+            decrypted_files = []
+            decryption_info = []
+            failed_files = []
+
+            for encrypted_name, original_filename, key, success, output_path in results:
+                if success:
+                    decrypted_files.append(output_path)
+                else:
+                    failed_files.append(encrypted_name)
+                decryption_info.append(
+                    (encrypted_name, original_filename, key, success)
+                )
+
+            if decrypted_files or failed_files:
+                # Prepare message for info panel
+                parts = []
+                if decrypted_files:
+                    parts.append(
+                        f"✓ Successfully decrypted {len(decrypted_files)} file(s)\n"
+                    )
+                if failed_files:
+                    parts.append(f"❌ Failed to decrypt {len(failed_files)} file(s)\n")
+                parts.append("\n")
+
+                # Show detailed info for each file
+                parts.append(SEP50 + "\n")
+                parts.append("=== DECRYPTION DETAILS ===\n")
+                parts.append(SEP50 + "\n")
+
+                for i, (enc_name, dec_name, key, success) in enumerate(
+                    decryption_info, 1
+                ):
+                    parts.append(f"\n--- FILE {i} ---\n")
+                    parts.append(f"Encrypted: {enc_name}\n")
+                    parts.append(f"Decrypted: {dec_name}\n")
+                    parts.append(f"Key Used: {key}\n")
+                    parts.append(f"Status: {'✓ Success' if success else '❌ Failed'}\n")
+                    if i < len(decryption_info):
+                        parts.append(SEP40 + "\n")
+
+                parts.append("\n" + SEP50 + "\n")
+                if decrypted_files:
+                    parts.append(
+                        "✓ Successful files have been restored to their original names\n"
+                    )
+                if failed_files:
+                    parts.append("❌ Failed files may have incorrect keys\n")
+                parts.append(SEP50)
+                message = "".join(parts)
+
+                # Display result using set_info
+                set_info(info_text, message)
+
+                # Show appropriate message
+                if decrypted_files and not failed_files:
+                    messagebox.showinfo(
+                        "Success",
+                        f"Successfully decrypted {len(decrypted_files)} file(s)!\nCheck the information panel for details.",
+                    )
+                elif decrypted_files and failed_files:
+                    messagebox.showwarning(
+                        "Partial Success",
+                        f"Decrypted {len(decrypted_files)} file(s), but {len(failed_files)} failed!\nCheck the information panel for details.",
+                    )
                 else:
                     messagebox.showerror(
-                        "Error", "File decryption failed. Please check your key."
+                        "Error",
+                        f"All {len(failed_files)} file(s) failed to decrypt!\nPlease check your keys.",
                     )
-            except Exception as e:
-                import traceback
 
-                error_details = traceback.format_exc()
-                print(f"File decryption error details:\n{error_details}")
+                if session_open(file_decrypt_dialog, session):
+                    hide_dialog(file_decrypt_dialog)
+            else:
                 messagebox.showerror(
-                    "Error",
-                    f"File decryption failed: {str(e)}\n\nCheck console for details.",
+                    "Error", "File decryption failed. Please check your key."
                 )
 
-        decrypt_files_btn = customtkinter.CTkButton(
-            file_decrypt_dialog,
-            text="Decrypt Files",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=perform_file_decryption,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        decrypt_files_btn.pack(pady=20)
+        # Decrypt on the worker pool so the dialog keeps repainting
+        decrypt_files_btn.configure(state="disabled")
+        session = file_decrypt_dialog.session
+        # Pass a snapshot: closing the dialog clears selected_files in place
+        run_in_background(app, on_decrypted, decrypt_all, list(selected_files), keys)
+
+    decrypt_files_btn = customtkinter.CTkButton(
+        file_decrypt_dialog,
+        text="Decrypt Files",
+        font=_font(14, "bold"),
+        command=perform_file_decryption,
+        **_DIALOG_BTN,
+    )
+    decrypt_files_btn.pack(pady=20)
+
+    def clear_fields():
+        # Start the next visit with an empty selection and no keys on screen
+        selected_files.clear()
+        set_lines(files_listbox, "", ())
+        key_textbox.delete("1.0", "end")
+
+    file_decrypt_dialog.on_hide = clear_fields
 
+
+def _handle_theme(app, info_text):
+    """Choose and save the appearance mode"""
+    post_info(info_text, "Theme settings: configure application appearance")
+
+    theme_dialog, created = show_cached_dialog(
+        app, "_theme_dialog", "Theme Settings", "600x500"
+    )
+    if not created:
+        theme_dialog.sync_theme()
         return
-    if choice == "Theme":
-        clear_info(info_text)
-        set_info(info_text, "Theme settings: configure application appearance")
-
-        # Create a dialog window for theme settings
-        theme_dialog = customtkinter.CTkToplevel(app)
-        theme_dialog.title("Theme Settings")
-        theme_dialog.geometry("600x500")
-        theme_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            theme_dialog,
-            text="Configure Application Theme",
-            font=customtkinter.CTkFont(size=18, weight="bold"),
-        )
-        instructions.pack(pady=(20, 10))
 
-        # Current theme display
-        current_theme = customtkinter.get_appearance_mode()
-        current_label = customtkinter.CTkLabel(
-            theme_dialog,
-            text=f"Current Theme: {current_theme}",
-            font=customtkinter.CTkFont(size=14),
-        )
-        current_label.pack(pady=10)
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        theme_dialog,
+        text="Configure Application Theme",
+        font=_font(18, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
+
+    # Current theme display
+    current_theme = customtkinter.get_appearance_mode()
+    current_label = customtkinter.CTkLabel(
+        theme_dialog,
+        text=f"Current Theme: {current_theme}",
+        font=_font(14),
+    )
+    current_label.pack(pady=10)
 
-        # Theme selection
-        theme_label = customtkinter.CTkLabel(
+    # Theme selection
+    theme_label = customtkinter.CTkLabel(
+        theme_dialog,
+        text="Select Theme:",
+        font=_font(14, "bold"),
+    )
+    theme_label.pack(pady=(20, 10))
+
+    theme_var = customtkinter.StringVar(value=current_theme)
+
+    # Theme radio buttons
+    themes = ["Light", "Dark", "System"]
+    for theme in themes:
+        radio = customtkinter.CTkRadioButton(
             theme_dialog,
-            text="Select Theme:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
+            text=theme,
+            variable=theme_var,
+            value=theme,
+            font=_font(13),
         )
-        theme_label.pack(pady=(20, 10))
-
-        theme_var = customtkinter.StringVar(value=current_theme)
-
-        # Theme radio buttons
-        themes = ["Light", "Dark", "System"]
-        for theme in themes:
-            radio = customtkinter.CTkRadioButton(
-                theme_dialog,
-                text=theme,
-                variable=theme_var,
-                value=theme,
-                font=customtkinter.CTkFont(size=13),
-            )
-            radio.pack(pady=5)
+        radio.pack(pady=5)
 
-        # Apply button
-        def apply_theme():
-            selected_theme = theme_var.get()
-            customtkinter.set_appearance_mode(selected_theme.lower())
+    def sync_theme():
+        # The cached dialog outlives theme changes; show the mode now in effect
+        current_theme = customtkinter.get_appearance_mode()
+        current_label.configure(text=f"Current Theme: {current_theme}")
+        theme_var.set(current_theme)
 
-            # Save theme to settings file
-            settings = load_settings()
-            settings["theme"] = selected_theme
-            save_settings(settings)
+    theme_dialog.sync_theme = sync_theme
 
-            set_info(
-                info_text,
-                f"✓ Theme changed to: {selected_theme}\n\nThe new theme has been applied and saved to settings.",
-            )
-            messagebox.showinfo(
-                "Success", f"Theme changed to {selected_theme} and saved successfully!"
-            )
-            theme_dialog.destroy()
+    # Apply button
+    def apply_theme():
+        selected_theme = theme_var.get()
+        # Restyles the native widgets through App._set_appearance_mode
+        customtkinter.set_appearance_mode(selected_theme.lower())
 
-        apply_btn = customtkinter.CTkButton(
-            theme_dialog,
-            text="Apply Theme",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=apply_theme,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        apply_btn.pack(pady=30)
+        # Save theme to settings file
+        settings = load_settings()
+        settings["theme"] = selected_theme
+        save_settings(settings)
 
-        return
-    if choice == "Security":
-        clear_info(info_text)
         set_info(
-            info_text, "Security settings: manage key storage and security options"
-        )
-
-        # Create a dialog window for security settings
-        security_dialog = customtkinter.CTkToplevel(app)
-        security_dialog.title("Security Settings")
-        security_dialog.geometry("700x600")
-        security_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            security_dialog,
-            text="Security Configuration",
-            font=customtkinter.CTkFont(size=18, weight="bold"),
+            info_text,
+            f"✓ Theme changed to: {selected_theme}\n\nThe new theme has been applied and saved to settings.",
         )
-        instructions.pack(pady=(20, 10))
-
-        # Security information
-        info_frame = customtkinter.CTkFrame(security_dialog)
-        info_frame.pack(pady=20, padx=30, fill="both", expand=True)
-
-        security_info = customtkinter.CTkTextbox(
-            info_frame,
-            height=300,
-            width=600,
-            font=customtkinter.CTkFont(size=12),
-            wrap="word",
+        messagebox.showinfo(
+            "Success", f"Theme changed to {selected_theme} and saved successfully!"
         )
-        security_info.pack(pady=10, padx=10, fill="both", expand=True)
+        hide_dialog(theme_dialog)
+
+    apply_btn = customtkinter.CTkButton(
+        theme_dialog,
+        text="Apply Theme",
+        font=_font(14, "bold"),
+        command=apply_theme,
+        **_DIALOG_BTN,
+    )
+    apply_btn.pack(pady=30)
+
 
-        security_text = """Security Best Practices:
+@lru_cache(maxsize=1)
+def _security_dialog_text() -> str:
+    """Security dialog body; the paths it names are fixed for the session"""
+    template = """Security Best Practices:
 
 1. Key Storage:
    • Store private keys in secure locations
@@ -1316,94 +1863,36 @@ Current Security Status:
 
 ⚠️ Warning: This application stores keys locally. 
 For production use, consider hardware security modules (HSM)."""
+    return template.format_map(
+        {
+            "encrypted_location": str(root_dir()),
+            "key_location": str(get_keys_directory()),
+        }
+    )
 
-        # Replace placeholders with actual paths
-        encrypted_location = str(ROOT_DIR)
-        key_location = str(get_keys_directory())
-        security_text = security_text.replace(
-            "{encrypted_location}", encrypted_location
-        )
-        security_text = security_text.replace("{key_location}", key_location)
-
-        security_info.insert("1.0", security_text)
-        security_info.configure(state="disabled")
-
-        # Close button
-        close_btn = customtkinter.CTkButton(
-            security_dialog,
-            text="Close",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=security_dialog.destroy,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        close_btn.pack(pady=20)
-
-        set_info(
-            info_text,
-            "Security settings displayed.\n\nReview security best practices in the dialog window.",
-        )
-
-        return
-    if choice == "Paths":
-        clear_info(info_text)
-        set_info(info_text, "Path settings: view and configure file locations")
-
-        # Create a dialog window for path settings
-        paths_dialog = customtkinter.CTkToplevel(app)
-        paths_dialog.title("Path Settings")
-        paths_dialog.geometry("700x600")
-        paths_dialog.grab_set()
-
-        # Instructions
-        instructions = customtkinter.CTkLabel(
-            paths_dialog,
-            text="Application Paths Configuration",
-            font=customtkinter.CTkFont(size=18, weight="bold"),
-        )
-        instructions.pack(pady=(20, 10))
-
-        # Paths information frame
-        paths_frame = customtkinter.CTkFrame(paths_dialog)
-        paths_frame.pack(pady=20, padx=30, fill="both", expand=True)
 
-        # Display current paths
-        paths_label = customtkinter.CTkLabel(
-            paths_frame,
-            text="Current Application Paths:",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-        )
-        paths_label.pack(pady=(10, 5), anchor="w", padx=10)
-
-        paths_info = customtkinter.CTkTextbox(
-            paths_frame,
-            height=300,
-            width=600,
-            font=customtkinter.CTkFont(size=12),
-            wrap="word",
-        )
-        paths_info.pack(pady=10, padx=10, fill="both", expand=True)
-
-        # Build path information
-        keys_dir = get_keys_directory()
-        paths_text = f"""Application Directory Paths:
+@lru_cache(maxsize=1)
+def _paths_dialog_text() -> str:
+    """Paths dialog body, formatted once per session"""
+    keys_dir = get_keys_directory()
+    template = """Application Directory Paths:
 
 1. Root Directory:
-   {ROOT_DIR}
+   {root_dir}
    • Contains main application files
 
 2. Key Files Directory:
    {keys_dir}
-   • Public Key: {keys_dir / "public_key.pem"}
-   • Private Key: {keys_dir / "private_key.pem"}
+   • Public Key: {public_key}
+   • Private Key: {private_key}
 
 3. Working Directory:
-   {os.getcwd()}
+   {cwd}
    • Current working directory
    • Default location for encrypted/decrypted files
 
 4. Home Directory:
-   {Path.home()}
+   {home}
    • User home directory
 
 File Naming Conventions:
@@ -1413,81 +1902,242 @@ File Naming Conventions:
 
 Note: You can select different directories when 
 encrypting or decrypting files using the file dialogs."""
+    return template.format_map(
+        {
+            "root_dir": root_dir(),
+            "keys_dir": keys_dir,
+            "public_key": keys_dir / "public_key.pem",
+            "private_key": keys_dir / "private_key.pem",
+            "cwd": os.getcwd(),
+            "home": Path.home(),
+        }
+    )
 
-        paths_info.insert("1.0", paths_text)
-        paths_info.configure(state="disabled")
 
-        # Open directory button
-        def open_root_dir():
-            import subprocess
-            import platform
+def _handle_security(app, info_text):
+    """Show security information"""
+    post_info(
+        info_text,
+        "Security settings displayed.\n\nReview security best practices in the dialog window.",
+    )
 
-            system = platform.system()
-            try:
-                if system == "Darwin":  # macOS
-                    subprocess.run(["open", str(ROOT_DIR)])
-                elif system == "Windows":
-                    subprocess.run(["explorer", str(ROOT_DIR)])
-                else:  # Linux and others
-                    subprocess.run(["xdg-open", str(ROOT_DIR)])
-                messagebox.showinfo("Success", f"Opened directory: {ROOT_DIR}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open directory: {str(e)}")
+    security_dialog, created = show_cached_dialog(
+        app, "_security_dialog", "Security Settings", "700x600"
+    )
+    if not created:
+        return
 
-        def open_keys_dir():
-            import subprocess
-            import platform
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        security_dialog,
+        text="Security Configuration",
+        font=_font(18, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
+
+    # Security information
+    info_frame = customtkinter.CTkFrame(security_dialog)
+    info_frame.pack(pady=20, padx=30, fill="both", expand=True)
+
+    security_info = customtkinter.CTkTextbox(
+        info_frame,
+        height=300,
+        width=600,
+        font=_font(12),
+        wrap="word",
+    )
+    security_info.pack(pady=10, padx=10, fill="both", expand=True)
 
-            system = platform.system()
-            keys_dir = get_keys_directory()
-            try:
-                if system == "Darwin":  # macOS
-                    subprocess.run(["open", str(keys_dir)])
-                elif system == "Windows":
-                    subprocess.run(["explorer", str(keys_dir)])
-                else:  # Linux and others
-                    subprocess.run(["xdg-open", str(keys_dir)])
-                messagebox.showinfo("Success", f"Opened keys directory: {keys_dir}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open directory: {str(e)}")
-
-        open_dir_btn = customtkinter.CTkButton(
-            paths_dialog,
-            text="Open Root Directory",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=open_root_dir,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        open_dir_btn.pack(pady=10)
-
-        open_keys_btn = customtkinter.CTkButton(
-            paths_dialog,
-            text="Open Keys Directory",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=open_keys_dir,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        open_keys_btn.pack(pady=10)
-
-        # Close button
-        close_btn = customtkinter.CTkButton(
-            paths_dialog,
-            text="Close",
-            font=customtkinter.CTkFont(size=14, weight="bold"),
-            command=paths_dialog.destroy,
-            fg_color=LIGHT_BLUE,
-            hover_color=DARK_BLUE,
-        )
-        close_btn.pack(pady=10)
+    security_info.insert("1.0", _security_dialog_text())
+    security_info.configure(state="disabled")
 
-        set_info(
-            info_text,
-            f"Path settings displayed.\n\nRoot directory: {ROOT_DIR}\nWorking directory: {os.getcwd()}",
-        )
+    # Close button
+    close_btn = customtkinter.CTkButton(
+        security_dialog,
+        text="Close",
+        font=_font(14, "bold"),
+        command=partial(hide_dialog, security_dialog),
+        **_DIALOG_BTN,
+    )
+    close_btn.pack(pady=20)
+
+
+def _handle_paths(app, info_text):
+    """Show application and key paths"""
+    post_info(
+        info_text,
+        f"Path settings displayed.\n\nRoot directory: {root_dir()}\nWorking directory: {os.getcwd()}",
+    )
+
+    paths_dialog, created = show_cached_dialog(
+        app, "_paths_dialog", "Path Settings", "700x600"
+    )
+    if not created:
+        return
+
+    # Instructions
+    instructions = customtkinter.CTkLabel(
+        paths_dialog,
+        text="Application Paths Configuration",
+        font=_font(18, "bold"),
+    )
+    instructions.pack(pady=(20, 10))
+
+    # Paths information frame
+    paths_frame = customtkinter.CTkFrame(paths_dialog)
+    paths_frame.pack(pady=20, padx=30, fill="both", expand=True)
+
+    # Display current paths
+    paths_label = customtkinter.CTkLabel(
+        paths_frame,
+        text="Current Application Paths:",
+        font=_font(14, "bold"),
+    )
+    paths_label.pack(pady=(10, 5), anchor="w", padx=10)
+
+    paths_info = customtkinter.CTkTextbox(
+        paths_frame,
+        height=300,
+        width=600,
+        font=_font(12),
+        wrap="word",
+    )
+    paths_info.pack(pady=10, padx=10, fill="both", expand=True)
+
+    paths_info.insert("1.0", _paths_dialog_text())
+    paths_info.configure(state="disabled")
+
+    # Open directory button
+    def open_root_dir():
+        try:
+            directory = root_dir()
+            open_directory(directory)
+            messagebox.showinfo("Success", f"Opened directory: {directory}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open directory: {str(e)}")
+
+    def open_keys_dir():
+        keys_dir = get_keys_directory()
+        try:
+            open_directory(keys_dir)
+            messagebox.showinfo("Success", f"Opened keys directory: {keys_dir}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open directory: {str(e)}")
+
+    open_dir_btn = customtkinter.CTkButton(
+        paths_dialog,
+        text="Open Root Directory",
+        font=_font(14, "bold"),
+        command=open_root_dir,
+        **_DIALOG_BTN,
+    )
+    open_dir_btn.pack(pady=10)
+
+    open_keys_btn = customtkinter.CTkButton(
+        paths_dialog,
+        text="Open Keys Directory",
+        font=_font(14, "bold"),
+        command=open_keys_dir,
+        **_DIALOG_BTN,
+    )
+    open_keys_btn.pack(pady=10)
+
+    # Close button
+    close_btn = customtkinter.CTkButton(
+        paths_dialog,
+        text="Close",
+        font=_font(14, "bold"),
+        command=partial(hide_dialog, paths_dialog),
+        **_DIALOG_BTN,
+    )
+    close_btn.pack(pady=10)
+
+
+# Dropdown/button label -> handler(app, info_text)
+_HANDLERS = {
+    "Exit": _handle_exit,
+    "RSA Key Data": _handle_rsa_key_data,
+    "RSA Key File": _handle_rsa_key_file,
+    "2048-bit": partial(_handle_generate, key_size=2048),
+    "3072-bit": partial(_handle_generate, key_size=3072),
+    "4096-bit": partial(_handle_generate, key_size=4096),
+    "Public Key": _handle_public_key,
+    "Private Key": _handle_private_key,
+    "Encrypt Data": _handle_encrypt_data,
+    "Encrypt File": _handle_encrypt_file,
+    "Decrypt Data": _handle_decrypt_data,
+    "Decrypt File": _handle_decrypt_file,
+    "Theme": _handle_theme,
+    "Security": _handle_security,
+    "Paths": _handle_paths,
+}
 
+
+def menu_action(app, info_text, choice: str):
+    """Handler for dropdown selections and Exit"""
+    handler = _HANDLERS.get(choice)
+    if handler is not None:
+        handler(app, info_text)
+
+
+def style_native_widgets(app) -> None:
+    """Color the main window's ttk widgets and info panel for the current appearance mode"""
+    palette = _NATIVE_PALETTE[customtkinter.get_appearance_mode().lower()]
+    old_color = _DEFAULT_INFO_COLOR
+    new_color = refresh_info_color()
+
+    style = ttk.Style(app)
+    style.theme_use("clam")
+    style.configure("TFrame", background=palette["window"])
+    style.configure("Panel.TFrame", background=palette["panel"])
+    style.configure("TLabel", background=palette["window"], foreground=palette["text"])
+    style.configure("Panel.TLabel", background=palette["panel"])
+    style.configure(
+        "Primary.TButton",
+        font=_font(16, "bold"),
+        background=BLUE,
+        foreground=RESET,
+        bordercolor=LIGHT_BLUE,
+        lightcolor=BLUE,
+        darkcolor=BLUE,
+        padding=6,
+    )
+    style.map(
+        "Primary.TButton",
+        background=[("active", DARK_BLUE)],
+        lightcolor=[("active", DARK_BLUE)],
+        darkcolor=[("active", DARK_BLUE)],
+    )
+
+    info_text = getattr(app, "info_text", None)
+    if info_text is not None:
+        info_text.configure(
+            background=palette["text_bg"],
+            foreground=palette["text"],
+            insertbackground=palette["text"],
+        )
+        if old_color is not None and old_color != new_color:
+            # Text already shown in the old default color would be unreadable
+            # on the new background; move it onto the new default tag
+            old_tag = _color_tag(info_text, old_color)
+            new_tag = _color_tag(info_text, new_color)
+            ranges = info_text.tag_ranges(old_tag)
+            for start, end in zip(ranges[::2], ranges[1::2]):
+                info_text.tag_add(new_tag, start, end)
+            info_text.tag_remove(old_tag, "1.0", "end")
+
+
+def preload_file_dialog(app) -> None:
+    """Source Tk's script-level file dialog ahead of the first Choose Files click
+    On X11, tk_getOpenFile is implemented in Tcl (tkfbox.tcl) and autoloaded on
+    first use; Windows and macOS use native dialogs, so there is nothing to load.
+    """
+    if app.tk.call("tk", "windowingsystem") != "x11":
         return
+    try:
+        app.tk.call("auto_load", "::tk::dialog::file::")
+    except tk.TclError:
+        pass
 
 
 def show_main_menu(title: str) -> None:
@@ -1495,6 +2145,7 @@ def show_main_menu(title: str) -> None:
     settings = load_settings()
     saved_theme = settings.get("theme", "System")
     customtkinter.set_appearance_mode(saved_theme.lower())
+    customtkinter.AppearanceModeTracker.update_loop_interval = _APPEARANCE_POLL_MS
 
     app = App(
         geometry="1000x1000",
@@ -1513,44 +2164,34 @@ def show_main_menu(title: str) -> None:
         description=None,
         info_content=None,
     )
-    # Now create the widgets
-    app.title_label = customtkinter.CTkLabel(
+    # Now create the widgets; the static main window uses native ttk widgets,
+    # which skip CTk's per-<Configure> canvas redraws. Dialogs stay CTk.
+    app.title_label = ttk.Label(
         app,
         text="Encryptor Main Menu",
-        font=customtkinter.CTkFont(size=24, weight="bold"),
+        font=_font(24, "bold"),
     )
     app.title_label.pack(pady=20)
 
-    app.main_frame = customtkinter.CTkFrame(app, fg_color="transparent")
+    app.main_frame = ttk.Frame(app)
     app.main_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
-    app.left_frame = customtkinter.CTkFrame(app.main_frame, width=300)
+    app.left_frame = ttk.Frame(app.main_frame, width=300, style="Panel.TFrame")
     app.left_frame.pack(side="left", fill="y", padx=(0, 10))
     app.left_frame.pack_propagate(False)
 
-    app.right_frame = customtkinter.CTkFrame(app.main_frame)
+    app.right_frame = ttk.Frame(app.main_frame, style="Panel.TFrame")
     app.right_frame.pack(side="right", fill="both", expand=True)
 
-    app.button_label = customtkinter.CTkLabel(
+    app.button_label = ttk.Label(
         app.left_frame,
         text="Choose an option:",
-        font=customtkinter.CTkFont(size=18, weight="bold"),
+        font=_font(18, "bold"),
+        style="Panel.TLabel",
     )
     app.button_label.pack(pady=(20, 15))
 
-    app.dropdown_map = {
-        "Import RSA Key": ["RSA Key Data", "RSA Key File"],
-        "Generate RSA Key Pair": ["2048-bit", "3072-bit", "4096-bit"],
-        "Display the RSA Keys": ["Public Key", "Private Key"],
-        "Encrypt/Decrypt": [
-            "Encrypt Data",
-            "Encrypt File",
-            "Decrypt Data",
-            "Decrypt File",
-        ],
-        "Settings": ["Theme", "Security", "Paths"],
-        "Help": ["User Guide", "FAQ", "About"],
-    }
+    app.dropdown_map = _DROPDOWN_MAP
 
     app.buttons_data = [
         ("Import RSA Key", "Import existing RSA keys from files"),
@@ -1562,68 +2203,85 @@ def show_main_menu(title: str) -> None:
         ("Exit", "Close the application safely"),
     ]
 
-    app.info_label = customtkinter.CTkLabel(
+    app.info_label = ttk.Label(
         app.right_frame,
         text="Information Panel",
-        font=customtkinter.CTkFont(size=20, weight="bold"),
+        font=_font(20, "bold"),
+        style="Panel.TLabel",
     )
     app.info_label.pack(pady=(20, 15))
 
-    app.info_text = customtkinter.CTkTextbox(
-        app.right_frame, height=300, width=350, font=customtkinter.CTkFont(size=14)
-    )
-    app.info_text.pack(pady=10, padx=20, fill="both", expand=True)
-
-    # Create buttons with blue shadow
-    for i, (button_text, description) in enumerate(app.buttons_data):
-        button = customtkinter.CTkButton(
-            app.left_frame,
-            text=button_text,
-            font=customtkinter.CTkFont(size=16, weight="bold"),
-            fg_color=BLUE,
-            hover_color=DARK_BLUE,
-            border_width=2,
-            border_color=LIGHT_BLUE,
-            command=lambda txt=button_text: None,
-        )
-        button.pack(pady=4, padx=20, fill="x")
-        button.bind(
-            "<Button-1>",
-            lambda e, txt=button_text, btn=button: app.on_button_click(e, txt, btn),
-        )
-
-    app.info_content = """Welcome to TinyEncryptor!
-
-    This application provides secure encryption and 
-    decryption capabilities using industry-standard 
-    algorithms.
+    info_container = ttk.Frame(app.right_frame, style="Panel.TFrame")
+    info_container.pack(pady=10, padx=20, fill="both", expand=True)
+
+    app.info_text = tk.Text(
+        info_container,
+        height=15,
+        width=40,
+        font=_font(14),
+        # Matches the wrap every set_info write uses, so the first fill needs
+        # no relayout
+        wrap="char",
+        relief="flat",
+        borderwidth=0,
+        highlightthickness=0,
+        padx=8,
+        pady=8,
+        # The panel stays in state="normal" (see make_read_only); hide the
+        # insert cursor so clicking it neither shows nor blinks a caret
+        insertwidth=0,
+        insertofftime=0,
+        # Read-only display: don't snapshot an undo stack on every insert
+        undo=False,
+        autoseparators=False,
+        maxundo=0,
+    )
+    info_scrollbar = ttk.Scrollbar(
+        info_container, orient="vertical", command=app.info_text.yview
+    )
+    app.info_text.configure(yscrollcommand=info_scrollbar.set)
+    info_scrollbar.pack(side="right", fill="y")
+    app.info_text.pack(side="left", fill="both", expand=True)
+    make_read_only(app.info_text)
+    init_color_tags(app.info_text)
+    style_native_widgets(app)
+
+    app.menus = {
+        key: build_menu(app, items, partial(menu_action, app, app.info_text))
+        for key, items in app.dropdown_map.items()
+    }
 
-    Features:
-    • RSA Encryption: Asymmetric encryption for secure key exchange
-    • Fernet Encryption: Symmetric encryption for fast file encryption
-    • Key Management: Generate, import, and manage encryption keys
-    • File Processing: Encrypt/decrypt data or files with ease
+    def build_buttons():
+        # The left frame doesn't propagate, so packing the whole column costs a
+        # single layout pass once it is complete
+        for button_text, description in app.buttons_data:
+            button = ttk.Button(
+                app.left_frame,
+                text=button_text,
+                style="Primary.TButton",
+            )
+            # The button's own command is the only click path; no extra bind
+            button.configure(command=partial(app.on_button_click, button_text, button))
+            button.pack(pady=4, padx=20, fill="x")
+        app.left_frame.update_idletasks()
 
-    Instructions:
-    1. Generate or import RSA keys first
-    2. Choose encryption method
-    3. Select files to process
-    4. Save or share encrypted files securely
-    5. Maintain Multiple RSA Key Pairs for different use cases
+    # Paint the title and info panel first; the buttons follow on the next idle
+    app.after_idle(build_buttons)
 
-    Decryption Process:
-    1. Enter or select the encrypted data/file
-    2. Provide the correct key/passphrase
-    3. Save the decrypted output securely
+    app.info_content = _WELCOME_PARAGRAPHS
 
-    Security Notice:
-    Keep your private keys secure and never share them. Always backup your keys in a safe location."""
+    # Set initial content with theme-aware colors, one paragraph per insert,
+    # once the window has painted
+    app.after_idle(set_info_chunks, app.info_text, app.info_content)
 
-    # Set initial content with theme-aware colors
-    set_info(app.info_text, app.info_content)
+    # Load the file dialog script once the window is up, off the click path
+    app.after(200, preload_file_dialog, app)
 
     app.mainloop()
 
+    # Cached fonts belong to this Tk interpreter; a later window builds its own
+    _FONT_CACHE.clear()
+
 
 def main():
     show_main_menu("TinyEncryptor Main Menu")